@@ -3,15 +3,21 @@ Configuration settings for Export for My Efficient Elements.
 
 This module contains all configurable settings for the application,
 making it easy to modify behavior without changing core code.
+
+Environment variables are snapshotted at import; set them before importing
+this module.
 """
 
 import os
-from pathlib import Path
+import tempfile
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 # Project paths
-PROJECT_ROOT = Path(__file__).parent.parent
-ASSETS_DIR = PROJECT_ROOT / "assets"
-LOGO_PATH = ASSETS_DIR / "EfficientElementsLogo.png"
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(PROJECT_ROOT, "assets")
+LOGO_PATH = os.path.join(ASSETS_DIR, "EfficientElementsLogo.png")
 
 # Application settings
 APP_NAME = "Export for My Efficient Elements"
@@ -20,7 +26,7 @@ DEFAULT_GROUP_NAME = "My Presentation"
 
 # GUI settings
 GUI_TITLE = APP_NAME
-GUI_ICON = str(LOGO_PATH)
+GUI_ICON = LOGO_PATH  # already a plain string path
 GUI_LAYOUT = "wide"  # "centered" or "wide"
 GUI_SIDEBAR_STATE = "collapsed"  # "expanded" or "collapsed"
 
@@ -31,7 +37,16 @@ LOGO_CENTER = True
 # File processing settings
 DEFAULT_THUMBNAIL_HEIGHT = 300  # pixels for thumbnail generation
 SUPPORTED_FILE_TYPES = ['pptx', 'ppt']
+SUPPORTED_SUFFIXES = frozenset(f'.{ext}' for ext in SUPPORTED_FILE_TYPES)  # for suffix lookups
 MAX_FILE_SIZE_MB = 200
+# Rendered thumbnails are reused for decks with identical content (None disables).
+# The directory is private to each user (the temp dir is already per user on Windows)
+THUMBNAIL_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(),
+    f"ee_thumb_cache_{os.getuid()}" if hasattr(os, 'getuid') else "ee_thumb_cache"
+)
+THUMBNAIL_CACHE_MAX_MB = 500  # least recently used entries are pruned beyond this
+THUMBNAIL_CACHE_MAX_AGE_DAYS = 30  # entries unused for longer are pruned
 
 # Output settings
 XML_FILENAME = "MyElements.xml"
@@ -42,37 +57,57 @@ ZIP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
 PROGRESS_UPDATE_DELAY = 0.2  # seconds between UI updates
 ENABLE_VERBOSE_OUTPUT = True
 
-# Thumbnail generation settings (PowerPoint to PDF to PNG pipeline)
-THUMBNAIL_METHODS = {
-    'powerpoint_applescript': {
-        'name': 'Microsoft PowerPoint via AppleScript',
-        'priority': 1,
-        'timeout': 60
-    },
-    'keynote_applescript': {
-        'name': 'Keynote via AppleScript',
-        'priority': 2,
-        'timeout': 60
-    },
-    'pdf2image': {
-        'name': 'pdf2image library',
-        'priority': 3,
-        'timeout': 60
-    },
-    'poppler': {
-        'name': 'Poppler utilities (pdftoppm)',
-        'priority': 4,
-        'timeout': 60
-    },
-    'simple_fallback': {
-        'name': 'simple_fallback',
-        'priority': 5,
-        'timeout': None
+# Thumbnail generation settings (PowerPoint to PDF to PNG pipeline).
+# Only the thumbnail pipeline needs this, so it is built on first access.
+@lru_cache(maxsize=1)
+def _thumbnail_methods() -> Mapping:
+    """Build the read-only thumbnail method metadata (cached after the first call)."""
+    methods = {
+        'powerpoint_applescript': {
+            'name': 'Microsoft PowerPoint via AppleScript',
+            'priority': 1,
+            'timeout': 60
+        },
+        'keynote_applescript': {
+            'name': 'Keynote via AppleScript',
+            'priority': 2,
+            'timeout': 60
+        },
+        'libreoffice': {
+            'name': 'LibreOffice (headless)',
+            'priority': 3,
+            'timeout': 120
+        },
+        'pdf2image': {
+            'name': 'pdf2image library',
+            'priority': 4,
+            'timeout': 60
+        },
+        'poppler': {
+            'name': 'Poppler utilities (pdftoppm)',
+            'priority': 5,
+            'timeout': 60
+        },
+        'simple_fallback': {
+            'name': 'simple_fallback',
+            'priority': 6,
+            'timeout': None
+        }
     }
-}
+    return MappingProxyType({key: MappingProxyType(value) for key, value in methods.items()})
+
+def get_thumbnail_methods() -> Mapping:
+    """Get the thumbnail conversion method metadata (built on first call, read-only)."""
+    return _thumbnail_methods()
 
-# Color scheme for UI
-COLORS = {
+def __getattr__(name: str):
+    """Resolve lazily-built settings such as THUMBNAIL_METHODS on access."""
+    if name == 'THUMBNAIL_METHODS':
+        return _thumbnail_methods()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Color scheme for UI (read-only; shared by every config getter)
+COLORS = MappingProxyType({
     'primary': '#2E86C1',
     'secondary': '#7F8C8D',
     'success': '#27AE60',
@@ -82,50 +117,67 @@ COLORS = {
     'dark': '#2C3E50',
     'purple': '#9B59B6',
     'brown': '#8B4513'
-}
+})
 
 # Progress panel colors
-PROGRESS_COLORS = {
+PROGRESS_COLORS = MappingProxyType({
     'creating_pptx': COLORS['info'],
     'creating_thumbnail': COLORS['warning'],
     'completed': COLORS['success'],
     'creating_xml': COLORS['purple'],
     'creating_zip': COLORS['brown'],
     'export_complete': COLORS['success']
-}
+})
 
-# Environment-specific settings
+# Environment-specific settings (read once; use get_debug()/get_log_level()
+# instead of calling os.getenv at call sites)
 DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
 # Performance settings
-PARALLEL_PROCESSING = False  # Future feature
-MAX_CONCURRENT_SLIDES = 3    # Future feature
-
-def get_asset_path(filename: str) -> Path:
+# Slide files are written in worker processes. Each worker loads the whole deck
+# uncompressed (media included) and sends every slide file back as pickled
+# bytes, so a deck is held once per worker on top of the main process's copy.
+# SLIDE_WORKER_MEMORY_MB caps the workers' copies combined: large decks get
+# fewer workers, and are written in-process if one copy doesn't fit.
+PARALLEL_PROCESSING = True   # Write individual slide files in worker processes
+MAX_CONCURRENT_SLIDES = os.cpu_count() or 1  # Worker processes for slide writing
+SLIDE_WORKER_MEMORY_MB = 1024  # Memory budget for the workers' copies of a deck
+
+def get_debug() -> bool:
+    """Get the DEBUG flag resolved from the environment at import."""
+    return DEBUG
+
+def get_log_level() -> str:
+    """Get the LOG_LEVEL resolved from the environment at import."""
+    return LOG_LEVEL
+
+def get_asset_path(filename: str) -> str:
     """Get the full path to an asset file."""
-    return ASSETS_DIR / filename
+    return os.path.join(ASSETS_DIR, filename)
 
 def get_logo_base64_path() -> str:
     """Get the logo path for base64 encoding."""
-    return str(LOGO_PATH)
+    return LOGO_PATH
 
-def get_app_config() -> dict:
-    """Get application configuration as a dictionary."""
-    return {
+@lru_cache(maxsize=1)
+def get_app_config() -> Mapping:
+    """Get application configuration as a dictionary (built once, read-only)."""
+    return MappingProxyType({
         'name': APP_NAME,
         'description': APP_DESCRIPTION,
-        'logo_path': str(LOGO_PATH),
+        'logo_path': LOGO_PATH,
         'logo_width': LOGO_WIDTH,
         'supported_types': SUPPORTED_FILE_TYPES,
         'max_file_size_mb': MAX_FILE_SIZE_MB,
         'colors': COLORS,
         'debug': DEBUG
-    }
+    })
 
-def get_gui_config() -> dict:
-    """Get GUI-specific configuration."""
-    return {
+@lru_cache(maxsize=1)
+def get_gui_config() -> Mapping:
+    """Get GUI-specific configuration (built once, read-only)."""
+    return MappingProxyType({
         'title': GUI_TITLE,
         'icon': GUI_ICON,
         'layout': GUI_LAYOUT,
@@ -133,16 +185,22 @@ def get_gui_config() -> dict:
         'logo_width': LOGO_WIDTH,
         'colors': COLORS,
         'progress_colors': PROGRESS_COLORS
-    }
+    })
 
-def get_processing_config() -> dict:
-    """Get processing-specific configuration."""
-    return {
+@lru_cache(maxsize=1)
+def get_processing_config() -> Mapping:
+    """Get processing-specific configuration (built once, read-only)."""
+    return MappingProxyType({
         'thumbnail_height': DEFAULT_THUMBNAIL_HEIGHT,
+        'thumbnail_cache_dir': THUMBNAIL_CACHE_DIR,
+        'thumbnail_cache_max_mb': THUMBNAIL_CACHE_MAX_MB,
+        'thumbnail_cache_max_age_days': THUMBNAIL_CACHE_MAX_AGE_DAYS,
         'xml_filename': XML_FILENAME,
         'temp_prefix': TEMP_DIR_PREFIX,
         'timestamp_format': ZIP_TIMESTAMP_FORMAT,
-        'thumbnail_methods': THUMBNAIL_METHODS,
         'progress_delay': PROGRESS_UPDATE_DELAY,
-        'verbose': ENABLE_VERBOSE_OUTPUT
-    }
+        'verbose': ENABLE_VERBOSE_OUTPUT,
+        'parallel_processing': PARALLEL_PROCESSING,
+        'max_workers': MAX_CONCURRENT_SLIDES,
+        'worker_memory_mb': SLIDE_WORKER_MEMORY_MB
+    })
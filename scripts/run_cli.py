@@ -7,6 +7,7 @@ presentations with full automation and debugging capabilities.
 """
 
 import sys
+import stat
 import argparse
 from pathlib import Path
 
@@ -14,8 +15,7 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from config.settings import get_app_config, SUPPORTED_FILE_TYPES
-from src.core.splitter import PowerPointSplitter
+from config.settings import get_app_config, SUPPORTED_FILE_TYPES, SUPPORTED_SUFFIXES
 
 
 def main():
@@ -82,19 +82,28 @@ Max file size: {app_config['max_file_size_mb']} MB
     args = parser.parse_args()
     
     try:
-        # Validate input file
+        # Validate input file with a single stat call; the splitter is told
+        # not to repeat these checks
         input_path = Path(args.input_file)
-        if not input_path.exists():
+        try:
+            input_stat = input_path.stat()
+        except OSError:
+            input_stat = None
+        if input_stat is None:
             print(f"❌ Error: Input file not found: {input_path}")
             sys.exit(1)
         
-        if not input_path.suffix.lower() in [f'.{ext}' for ext in SUPPORTED_FILE_TYPES]:
+        if not stat.S_ISREG(input_stat.st_mode):
+            print(f"❌ Error: Input path is not a file: {input_path}")
+            sys.exit(1)
+        
+        if input_path.suffix.lower() not in SUPPORTED_SUFFIXES:
             supported_ext = ', '.join([f'.{ext}' for ext in SUPPORTED_FILE_TYPES])
             print(f"❌ Error: Input file must be a PowerPoint file ({supported_ext})")
             sys.exit(1)
         
         # Check file size
-        file_size_mb = input_path.stat().st_size / (1024 * 1024)
+        file_size_mb = input_stat.st_size / (1024 * 1024)
         if file_size_mb > app_config['max_file_size_mb']:
             print(f"❌ Error: File size ({file_size_mb:.1f} MB) exceeds maximum allowed size ({app_config['max_file_size_mb']} MB)")
             sys.exit(1)
@@ -105,26 +114,31 @@ Max file size: {app_config['max_file_size_mb']} MB
             # Use the presentation filename (without extension) as default group name
             group_name = input_path.stem
         
+        # Imported here so --help, --version and argument errors skip loading
+        # python-pptx and the imaging libraries
+        from src.core.splitter import PowerPointSplitter
+        
         # Create the splitter
         splitter = PowerPointSplitter(
             input_file=str(input_path),
             output_dir=args.output_dir,
             group_name=group_name,
-            base_name=args.base_name
+            base_name=args.base_name,
+            already_validated=True
         )
         
         # Split the slides
-        created_files = splitter.split_slides()
+        slide_entries = splitter.split_slides()
         
-        print(f"\n✅ Successfully created {len(created_files)} individual slide files")
+        print(f"\n✅ Successfully created {len(slide_entries)} individual slide files")
         
         if args.verbose:
             print(f"📁 Working directory: {splitter.output_dir}")
             print(f"🏷️  Group name: {group_name}")
             print(f"📦 Base name: {splitter.base_name}")
-            print("\nCreated files:")
-            for file_path in created_files:
-                print(f"  • {Path(file_path).name}")
+            print(f"\nArchive contents ({splitter.zip_path.name}):")
+            for entry_name in slide_entries:
+                print(f"  • {entry_name}")
         
     except FileNotFoundError as e:
         print(f"❌ Error: {e}")
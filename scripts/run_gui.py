@@ -6,7 +6,6 @@ This script launches the Streamlit web interface for user-friendly
 PowerPoint processing with real-time progress tracking.
 """
 
-import subprocess
 import sys
 import os
 from pathlib import Path
@@ -33,33 +32,31 @@ def main():
     # Change to project directory for proper imports
     os.chdir(project_root)
     
-    # Add project root to Python path for imports
-    env = os.environ.copy()
-    if 'PYTHONPATH' in env:
-        env['PYTHONPATH'] = f"{project_root}:{env['PYTHONPATH']}"
+    # Add project root to Python path for imports (this process and any
+    # worker processes it starts)
+    sys.path.insert(0, str(project_root))
+    if 'PYTHONPATH' in os.environ:
+        os.environ['PYTHONPATH'] = f"{project_root}:{os.environ['PYTHONPATH']}"
     else:
-        env['PYTHONPATH'] = str(project_root)
+        os.environ['PYTHONPATH'] = str(project_root)
     
     try:
-        # Launch Streamlit with the new app location
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
-            str(streamlit_app),
-            "--server.address", "localhost",
-            "--server.port", "8501",
-            "--browser.gatherUsageStats", "false"
-        ], env=env)
-        
-    except KeyboardInterrupt:
-        print("\n👋 GUI server stopped.")
-    except subprocess.CalledProcessError as e:
+        from streamlit.web import cli as streamlit_cli
+    except ImportError as e:
         print(f"❌ Error launching GUI: {e}")
         print("💡 Make sure Streamlit is installed: pip install streamlit")
         print("💡 Check that all dependencies are available")
         sys.exit(1)
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        sys.exit(1)
+    
+    # Run Streamlit in this interpreter instead of starting a second one
+    sys.argv = [
+        "streamlit", "run", 
+        str(streamlit_app),
+        "--server.address", "localhost",
+        "--server.port", "8501",
+        "--browser.gatherUsageStats", "false"
+    ]
+    sys.exit(streamlit_cli.main())
 
 if __name__ == "__main__":
     main()
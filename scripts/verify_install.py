@@ -3,32 +3,35 @@
 Quick verification script to test if all dependencies are installed correctly.
 """
 
+import importlib.util
+from importlib.metadata import PackageNotFoundError, version
+
+
 def verify_installation():
-    """Verify that all required dependencies are installed."""
+    """
+    Verify that all required dependencies are installed.
+    
+    Modules are located with importlib.util.find_spec instead of being
+    imported, so python-pptx (and the lxml/Pillow extensions it loads) is
+    never initialized just to check that it is there.
+    """
     print("🔍 Verifying installation...")
     
-    try:
-        import pptx
-        print("✅ python-pptx library is installed")
-        print(f"   Version: {pptx.__version__}")
-    except ImportError:
+    if importlib.util.find_spec("pptx") is None:
         print("❌ python-pptx library is NOT installed")
         print("   Please run: pip install -r requirements.txt")
         return False
-    
+    print("✅ python-pptx library is installed")
     try:
-        import uuid
-        print("✅ uuid module is available")
-    except ImportError:
-        print("❌ uuid module is NOT available")
-        return False
+        print(f"   Version: {version('python-pptx')}")
+    except PackageNotFoundError:
+        pass
     
-    try:
-        from pathlib import Path
-        print("✅ pathlib module is available")
-    except ImportError:
-        print("❌ pathlib module is NOT available")
-        return False
+    for module_name in ("uuid", "pathlib"):
+        if importlib.util.find_spec(module_name) is None:
+            print(f"❌ {module_name} module is NOT available")
+            return False
+        print(f"✅ {module_name} module is available")
     
     print("\n🎉 All dependencies are installed correctly!")
     print("📝 You can now use the PowerPoint splitter:")
@@ -0,0 +1,341 @@
+"""
+Package-level PPTX slide extraction for Export for My Efficient Elements.
+
+A .pptx file is a ZIP of XML parts tied together by relationship files. This
+module produces single-slide copies of a deck, and reads the slide text used
+for naming them, by working on those parts directly instead of loading the
+full python-pptx object model.
+"""
+
+import posixpath
+import zipfile
+from io import BytesIO
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from lxml import etree
+
+
+# OPC package and PresentationML namespaces
+CONTENT_TYPES_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+OFFICE_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PRESENTATION_NS = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+DRAWING_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+
+_P = f'{{{PRESENTATION_NS}}}'
+_A = f'{{{DRAWING_NS}}}'
+
+NAMESPACES = {'p': PRESENTATION_NS, 'a': DRAWING_NS}
+
+# Precompiled queries for reading slide text. Top-level shapes are the
+# children of the shape tree that python-pptx treats as shapes
+_SLIDE_SHAPES = etree.XPath(
+    'p:cSld/p:spTree/*[self::p:sp or self::p:grpSp or self::p:graphicFrame'
+    ' or self::p:cxnSp or self::p:pic or self::p:contentPart]',
+    namespaces=NAMESPACES
+)
+_SHAPE_PLACEHOLDER = etree.XPath('*[1]/p:nvPr/p:ph', namespaces=NAMESPACES)
+_SHAPE_PARAGRAPHS = etree.XPath('p:txBody/a:p', namespaces=NAMESPACES)
+_PARAGRAPH_CONTENT = etree.XPath('a:r/a:t | a:fld/a:t | a:br', namespaces=NAMESPACES)
+
+CONTENT_TYPES_PART = '[Content_Types].xml'
+ROOT_RELS_PART = '_rels/.rels'
+
+
+def _rels_name(part_name: str) -> str:
+    """Return the relationships part name for a package part."""
+    directory, filename = posixpath.split(part_name)
+    return posixpath.join(directory, '_rels', f'{filename}.rels')
+
+
+def _rel_kind(rel_type: str) -> str:
+    """Return the last segment of a relationship type URI (e.g. 'slide')."""
+    return rel_type.rsplit('/', 1)[-1]
+
+
+def _serialize(root) -> bytes:
+    """Serialize an edited XML part the way Office writes it."""
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _resolve_target(part_name: str, target: str) -> str:
+    """Resolve a relationship target to a zip entry name."""
+    target = unquote(target)
+    if target.startswith('/'):
+        return target.lstrip('/')
+    base_dir = posixpath.dirname(part_name)
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def _find_presentation_part(root_rels: List[etree._Element]) -> str:
+    """Locate the main presentation part from the package relationships."""
+    for rel in root_rels:
+        if _rel_kind(rel.get('Type', '')) == 'officeDocument':
+            return _resolve_target('', rel.get('Target'))
+    raise ValueError("Not a PowerPoint package: no presentation part found")
+
+
+def _placeholder(shape) -> Optional[etree._Element]:
+    """Return the p:ph element of a shape, or None if it is not a placeholder."""
+    placeholders = _SHAPE_PLACEHOLDER(shape)
+    return placeholders[0] if placeholders else None
+
+
+def _shape_text(shape) -> str:
+    """
+    Get the text of a p:sp shape the way python-pptx's text_frame.text does.
+    
+    Paragraphs are joined with newlines and line breaks become vertical tabs.
+    """
+    return '\n'.join(
+        ''.join(
+            '\v' if element.tag == f'{_A}br' else (element.text or '')
+            for element in _PARAGRAPH_CONTENT(paragraph)
+        )
+        for paragraph in _SHAPE_PARAGRAPHS(shape)
+    )
+
+
+def slide_title(slide) -> Optional[str]:
+    """
+    Get the text of a slide's title placeholder.
+    
+    Args:
+        slide: Root element of a slide part
+        
+    Returns:
+        The title text, or None if the slide has no text title placeholder
+    """
+    for shape in _SLIDE_SHAPES(slide):
+        placeholder = _placeholder(shape)
+        # The title placeholder is the one with idx 0 (the default)
+        if placeholder is not None and placeholder.get('idx', '0') == '0':
+            return _shape_text(shape) if shape.tag == f'{_P}sp' else None
+    return None
+
+
+def slide_texts(slide) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield the text of each top-level text shape on a slide.
+    
+    Args:
+        slide: Root element of a slide part
+        
+    Yields:
+        Tuples of (text, is_placeholder) in document order
+    """
+    for shape in _SLIDE_SHAPES(slide):
+        if shape.tag == f'{_P}sp':
+            yield _shape_text(shape), _placeholder(shape) is not None
+
+
+def count_slides(pptx_file) -> int:
+    """
+    Count the slides in a PPTX file without loading the whole package.
+    
+    Only the package relationships and the presentation part are read.
+    
+    Args:
+        pptx_file: Path to the PPTX file, or a readable binary file object
+        
+    Returns:
+        Number of slides in the presentation
+    """
+    with zipfile.ZipFile(pptx_file) as source_zip:
+        root_rels = list(etree.fromstring(source_zip.read(ROOT_RELS_PART)))
+        presentation_part = _find_presentation_part(root_rels)
+        presentation = etree.fromstring(source_zip.read(presentation_part))
+    
+    sld_id_lst = presentation.find(f'{_P}sldIdLst')
+    return 0 if sld_id_lst is None else len(sld_id_lst)
+
+
+class PresentationPackage:
+    """Read a PPTX package once and write single-slide copies of it."""
+    
+    def __init__(self, source_bytes: bytes):
+        """
+        Load every part of the package into memory.
+        
+        Args:
+            source_bytes: Contents of the original PPTX file
+        """
+        with zipfile.ZipFile(BytesIO(source_bytes)) as source_zip:
+            self._entries: List[zipfile.ZipInfo] = source_zip.infolist()
+            self._parts: Dict[str, bytes] = {
+                info.filename: source_zip.read(info) for info in self._entries
+            }
+        
+        self._rels_cache: Dict[str, List[etree._Element]] = {}
+        self.presentation_part = _find_presentation_part(self._relationships(''))
+        self.presentation_rels_part = _rels_name(self.presentation_part)
+    
+    def uncompressed_size(self) -> int:
+        """
+        Get the memory taken by the loaded parts.
+        
+        Returns:
+            Total uncompressed size of the package's parts in bytes
+        """
+        return sum(info.file_size for info in self._entries)
+    
+    def slide_parts(self) -> List[str]:
+        """
+        Get the slide parts of the presentation.
+        
+        Returns:
+            Zip entry names of the slide parts, in presentation order
+        """
+        presentation = etree.fromstring(self._parts[self.presentation_part])
+        sld_id_lst = presentation.find(f'{_P}sldIdLst')
+        if sld_id_lst is None:
+            return []
+        
+        targets = {
+            rel.get('Id'): _resolve_target(self.presentation_part, rel.get('Target'))
+            for rel in self._relationships(self.presentation_part)
+        }
+        return [targets[sld_id.get(f'{{{OFFICE_REL_NS}}}id')] for sld_id in sld_id_lst]
+    
+    def read_xml(self, part_name: str) -> etree._Element:
+        """
+        Parse a part of the package.
+        
+        Args:
+            part_name: Zip entry name of the part
+            
+        Returns:
+            Root element of the parsed part
+        """
+        return etree.fromstring(self._parts[part_name])
+    
+    def _relationships(self, part_name: str) -> List[etree._Element]:
+        """
+        Get the parsed relationships of a part ('' for the package itself).
+        
+        Args:
+            part_name: Zip entry name of the source part
+        
+        Returns:
+            List of Relationship elements (empty if the part has none)
+        """
+        if part_name not in self._rels_cache:
+            rels_part = ROOT_RELS_PART if not part_name else _rels_name(part_name)
+            rels_xml = self._parts.get(rels_part)
+            self._rels_cache[part_name] = (
+                list(etree.fromstring(rels_xml)) if rels_xml is not None else []
+            )
+        return self._rels_cache[part_name]
+    
+    def _reachable_parts(self, presentation_rels: List[etree._Element]) -> Set[str]:
+        """
+        Collect every part reachable from the package relationships.
+        
+        Args:
+            presentation_rels: Relationships to use for the presentation part
+        
+        Returns:
+            Set of zip entry names for the parts to keep
+        """
+        reachable: Set[str] = set()
+        pending = ['']
+        while pending:
+            part_name = pending.pop()
+            if part_name == self.presentation_part:
+                rels = presentation_rels
+            else:
+                rels = self._relationships(part_name)
+            
+            for rel in rels:
+                if rel.get('TargetMode') == 'External':
+                    continue
+                target = _resolve_target(part_name, rel.get('Target'))
+                if target not in reachable and target in self._parts:
+                    reachable.add(target)
+                    pending.append(target)
+        
+        return reachable
+    
+    def build_single_slide(self, slide_index: int) -> Dict[str, bytes]:
+        """
+        Build the parts of a package containing only one slide.
+        
+        Args:
+            slide_index: Index of the slide in the original presentation
+        
+        Returns:
+            Mapping of zip entry names to their contents
+        """
+        presentation = etree.fromstring(self._parts[self.presentation_part])
+        sld_id_lst = presentation.find(f'{_P}sldIdLst')
+        if sld_id_lst is None or not 0 <= slide_index < len(sld_id_lst):
+            raise IndexError(f"Slide index {slide_index} out of range")
+        
+        # Keep only the target slide in the slide list
+        for i, sld_id in reversed(list(enumerate(sld_id_lst))):
+            if i != slide_index:
+                sld_id_lst.remove(sld_id)
+        
+        # Drop slide relationships that nothing in presentation.xml still refers to
+        referenced_ids = {
+            value
+            for element in presentation.iter()
+            for name, value in element.attrib.items()
+            if name.startswith(f'{{{OFFICE_REL_NS}}}')
+        }
+        rels_root = etree.fromstring(self._parts[self.presentation_rels_part])
+        for rel in list(rels_root):
+            if _rel_kind(rel.get('Type', '')) == 'slide' and rel.get('Id') not in referenced_ids:
+                rels_root.remove(rel)
+        
+        # Keep only parts still reachable, which removes other slides and their notes
+        kept_parts = self._reachable_parts(list(rels_root))
+        
+        content_types = etree.fromstring(self._parts[CONTENT_TYPES_PART])
+        for override in content_types.findall(f'{{{CONTENT_TYPES_NS}}}Override'):
+            if override.get('PartName', '').lstrip('/') not in kept_parts:
+                content_types.remove(override)
+        
+        kept_names = {CONTENT_TYPES_PART, ROOT_RELS_PART}
+        for part_name in kept_parts:
+            kept_names.add(part_name)
+            rels_part = _rels_name(part_name)
+            if rels_part in self._parts:
+                kept_names.add(rels_part)
+        
+        parts = {name: data for name, data in self._parts.items() if name in kept_names}
+        parts[CONTENT_TYPES_PART] = _serialize(content_types)
+        parts[self.presentation_part] = _serialize(presentation)
+        parts[self.presentation_rels_part] = _serialize(rels_root)
+        return parts
+    
+    def write_single_slide(self, slide_index: int, output_file) -> None:
+        """
+        Write a copy of the presentation containing only one slide.
+        
+        Args:
+            slide_index: Index of the slide in the original presentation
+            output_file: Path of the PPTX file to create, or a writable binary file object
+        """
+        parts = self.build_single_slide(slide_index)
+        
+        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as output_zip:
+            # Keep the source entry order and per-entry compression
+            for info in self._entries:
+                if info.filename in parts:
+                    output_zip.writestr(info.filename, parts[info.filename],
+                                        compress_type=info.compress_type)
+    
+    def single_slide_bytes(self, slide_index: int) -> bytes:
+        """
+        Get the contents of a PPTX file containing only one slide.
+        
+        Args:
+            slide_index: Index of the slide in the original presentation
+            
+        Returns:
+            The single-slide PPTX file as bytes
+        """
+        buffer = BytesIO()
+        self.write_single_slide(slide_index, buffer)
+        return buffer.getvalue()
@@ -8,32 +8,100 @@ This module contains the main PowerPointSplitter class responsible for:
 - Managing file operations and cleanup
 """
 
-import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import TYPE_CHECKING, List, Dict, Optional, Callable
 
-try:
-    from pptx import Presentation
-except ImportError as e:
-    print("Error: Missing required library: python-pptx")
-    print("Please install it using: pip install python-pptx")
-    raise
-
-from config.settings import get_processing_config, SUPPORTED_FILE_TYPES
-from src.core.thumbnail_generator import SlideThumbnailGenerator
-from src.core.xml_generator import XMLGenerator
+from config.settings import get_processing_config, SUPPORTED_FILE_TYPES, SUPPORTED_SUFFIXES
 from src.utils.uuid_utils import generate_unique_uuid, generate_reproducible_uuid
 from src.utils.file_utils import (
     create_temp_directory, 
-    create_zip_archive, 
+    open_zip_archive,
+    add_bytes_to_zip,
+    add_file_to_zip,
     cleanup_files,
     cleanup_directory,
+    schedule_cleanup,
     generate_timestamped_filename,
     get_file_size_mb,
     validate_file_access
 )
 
+# python-pptx, lxml and Pillow are imported where they are first used, so that
+# importing this module (e.g. for CLI argument handling) stays cheap
+if TYPE_CHECKING:
+    from src.core.pptx_package import PresentationPackage
+
+
+# Per-slide progress events that may be dropped when they arrive faster than
+# the configured progress delay; completions and the final steps always pass
+THROTTLED_PROGRESS_STATUSES = frozenset({'creating_pptx', 'creating_thumbnail'})
+
+# Source package held by each slide-writing worker process
+_worker_package: Optional['PresentationPackage'] = None
+
+
+def _init_slide_worker(source_path: str) -> None:
+    """
+    Load the source deck package once per worker process.
+    
+    Workers read the deck themselves, so its bytes aren't pickled and sent
+    to each of them.
+    """
+    from src.core.pptx_package import PresentationPackage
+    
+    global _worker_package
+    _worker_package = PresentationPackage(Path(source_path).read_bytes())
+
+
+def _build_single_slide(slide_index: int, package: Optional['PresentationPackage'] = None) -> bytes:
+    """
+    Build a single-slide copy of a presentation in memory.
+    
+    Module-level so it can run in a worker process, where the source package
+    comes from _init_slide_worker instead of being sent with every task.
+    
+    Args:
+        slide_index: Index of the slide in the original presentation
+        package: Loaded source package (defaults to the worker's copy)
+    
+    Returns:
+        Contents of the single-slide PPTX file
+    """
+    if package is None:
+        package = _worker_package
+    return package.single_slide_bytes(slide_index)
+
+
+class ThrottledProgress:
+    """
+    Progress callback wrapper that limits how often per-slide events are reported.
+    
+    Events are filtered synchronously on the calling thread, so the wrapped
+    callback always runs where split_slides runs (Streamlit widgets can only
+    be updated from the script thread).
+    """
+    
+    def __init__(self, callback: Callable, min_interval: float):
+        """
+        Wrap a progress callback.
+        
+        Args:
+            callback: Progress callback taking (current_slide, total_slides, slide_title, status)
+            min_interval: Minimum seconds between reported per-slide events
+        """
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_report = float('-inf')
+    
+    def __call__(self, current_slide: int, total_slides: int, slide_title: str, status: str) -> None:
+        now = time.monotonic()
+        if status in THROTTLED_PROGRESS_STATUSES and now - self._last_report < self._min_interval:
+            return
+        self._last_report = now
+        self._callback(current_slide, total_slides, slide_title, status)
+
 
 class PowerPointSplitter:
     """Class to handle splitting PowerPoint presentations into individual slides."""
@@ -43,7 +111,8 @@ class PowerPointSplitter:
         input_file: str, 
         output_dir: Optional[str] = None, 
         group_name: Optional[str] = None, 
-        base_name: Optional[str] = None
+        base_name: Optional[str] = None,
+        already_validated: bool = False
     ):
         """
         Initialize the PowerPoint splitter.
@@ -53,6 +122,7 @@ class PowerPointSplitter:
             output_dir: Directory to save the individual slide files (optional, uses temp dir if not provided)
             group_name: Name of the group for XML metadata
             base_name: Base name for the output zip file (optional, uses input filename if not provided)
+            already_validated: Skip input file checks the caller has already done
         """
         self.config = get_processing_config()
         self.input_file = Path(input_file)
@@ -60,14 +130,24 @@ class PowerPointSplitter:
         self.base_name = base_name or self.input_file.stem
         
         # Initialize generators
+        from src.core.thumbnail_generator import SlideThumbnailGenerator
+        from src.core.xml_generator import XMLGenerator
+        
         self.thumbnail_generator = SlideThumbnailGenerator()
         self.xml_generator = XMLGenerator()
         
         # Track if we created a temporary directory
         self.temp_dir_created = False
         
+        # Files written by this splitter, archived and cleaned up without rescanning the directory
+        self._produced_files: List[Path] = []
+        
+        # Archive written by the last successful split_slides() call
+        self.zip_path: Optional[Path] = None
+        
         # Validate input file
-        self._validate_input_file()
+        if not already_validated:
+            self._validate_input_file()
         
         # Set up output directory
         self._setup_output_directory(output_dir)
@@ -78,7 +158,7 @@ class PowerPointSplitter:
         if not is_valid:
             raise FileNotFoundError(error_msg)
         
-        if not self.input_file.suffix.lower() in [f'.{ext}' for ext in SUPPORTED_FILE_TYPES]:
+        if self.input_file.suffix.lower() not in SUPPORTED_SUFFIXES:
             supported_ext = ', '.join([f'.{ext}' for ext in SUPPORTED_FILE_TYPES])
             raise ValueError(f"Input file must be a PowerPoint file ({supported_ext})")
     
@@ -100,136 +180,214 @@ class PowerPointSplitter:
         
         Args:
             progress_callback: Optional callback function to report progress.
-                             Called with (current_slide, total_slides, slide_title, status)
+                             Called with (current_slide, total_slides, slide_title, status);
+                             per-slide events are throttled to the progress_delay setting
         
         Returns:
-            List of created file paths
+            Names of the slide files in the zip archive (slide files are
+            streamed into the archive and never written to disk)
         """
-        if self.config['verbose']:
+        from src.core.pptx_package import PresentationPackage
+        
+        # Bind per-run lookups used inside the slide loop once
+        verbose = self.config['verbose']
+        if progress_callback:
+            progress_callback = ThrottledProgress(progress_callback, self.config['progress_delay'])
+        thumbnail_generator = self.thumbnail_generator
+        
+        if verbose:
             print(f"📂 Loading presentation: {self.input_file}")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        zip_path = None
         
         try:
-            # Load the original presentation
-            presentation = Presentation(self.input_file)
-            total_slides = len(presentation.slides)
+            # Read the original presentation once; every slide copy is built
+            # from these bytes instead of round-tripping through disk
+            source_bytes = self.input_file.read_bytes()
+            package = PresentationPackage(source_bytes)
+            slide_parts = package.slide_parts()
+            total_slides = len(slide_parts)
             
-            if self.config['verbose']:
+            if verbose:
                 print(f"📊 Found {total_slides} slides to process")
                 print(f"⚡ Using high-quality thumbnail generation with best available method")
             
-            created_files = []
+            slide_entries = []
             slide_metadata = []
             
-            # Optimized bulk thumbnail generation - convert entire presentation to PDF once
-            if self.config['verbose']:
-                print(f"🚀 Using optimized bulk thumbnail generation...")
+            # Resolve names and output paths up front so slide files can be
+            # written in worker processes while thumbnails are handled here
+            slide_names = [
+                self._extract_slide_name(package.read_xml(part_name), i)
+                for i, part_name in enumerate(slide_parts, 1)
+            ]
+            file_uuids = [generate_unique_uuid() for _ in range(total_slides)]
+            output_files = [self.output_dir / f"{file_uuid}.pptx" for file_uuid in file_uuids]
             
-            # Generate all thumbnails at once using bulk conversion
-            bulk_thumbnail_paths = self.thumbnail_generator.create_high_quality_thumbnails_bulk(
-                self.input_file, total_slides
-            )
-            
-            # Process each slide with pre-generated thumbnails
-            for i, slide in enumerate(presentation.slides, 1):
-                if self.config['verbose']:
-                    print(f"Processing slide {i}/{total_slides}...", end=" ")
-                
-                # Extract slide name/title first
-                slide_name = self._extract_slide_name(slide, i)
+            # Slides, thumbnails and metadata are streamed into the archive as
+            # they are produced, so slide files never touch the disk
+            zip_path = self.input_file.parent / generate_timestamped_filename(self.base_name, "zip")
+            archive = open_zip_archive(zip_path)
+            executor = None
+            thumbnail_executor = None
+            try:
+                executor = self._create_slide_executor(total_slides, package)
+                if executor is not None:
+                    # Workers load their own copy; release the one used for names
+                    package = None
+                    pending_slides = [
+                        executor.submit(_build_single_slide, index)
+                        for index in range(total_slides)
+                    ]
                 
-                # Report progress - starting slide processing
-                if progress_callback:
-                    progress_callback(i, total_slides, slide_name, "creating_pptx")
+                # Optimized bulk thumbnail generation - convert entire presentation to
+                # PDF once. The workers build the slide files in the meantime
+                if verbose:
+                    print(f"🚀 Using optimized bulk thumbnail generation...")
                 
-                # Create individual slide presentation
-                new_presentation = self._create_single_slide_presentation(presentation, slide, i-1)
+                bulk_thumbnail_paths = thumbnail_generator.create_high_quality_thumbnails_bulk(
+                    self.input_file, total_slides
+                )
                 
-                # Generate unique UUID for the filename
-                file_uuid = generate_unique_uuid()
-                output_file = self.output_dir / f"{file_uuid}.pptx"
+                # Resize the bulk thumbnails concurrently; sips runs as a separate
+                # process and Pillow releases the GIL while decoding/resampling
+                if self.config['parallel_processing'] and total_slides > 1:
+                    thumbnail_executor = ThreadPoolExecutor(
+                        max_workers=max(1, min(self.config['max_workers'], total_slides))
+                    )
+                    pending_thumbnails = [None] * total_slides
+                    for index, temp_path in enumerate(bulk_thumbnail_paths[:total_slides]):
+                        if temp_path:
+                            pending_thumbnails[index] = thumbnail_executor.submit(
+                                self._process_bulk_thumbnail, temp_path, file_uuids[index]
+                            )
                 
-                # Save the new presentation
-                new_presentation.save(str(output_file))
-                created_files.append(str(output_file))
+                # Process each slide with pre-generated thumbnails
+                for i, (slide_name, file_uuid, output_file) in enumerate(
+                    zip(slide_names, file_uuids, output_files), 1
+                ):
+                    if verbose:
+                        print(f"Processing slide {i}/{total_slides}...", end=" ")
+                    
+                    # Report progress - starting slide processing
+                    if progress_callback:
+                        progress_callback(i, total_slides, slide_name, "creating_pptx")
+                    
+                    # Wait for (or build) the individual slide presentation
+                    if executor is not None:
+                        pptx_bytes = pending_slides[i-1].result()
+                    elif total_slides == 1:
+                        # A one-slide deck already is its own single-slide copy
+                        pptx_bytes = source_bytes
+                    else:
+                        pptx_bytes = _build_single_slide(i-1, package)
+                    add_bytes_to_zip(archive, output_file.name, pptx_bytes)
+                    slide_entries.append(output_file.name)
+                    
+                    # Report progress - processing thumbnail (already generated)
+                    if progress_callback:
+                        progress_callback(i, total_slides, slide_name, "creating_thumbnail")
+                    
+                    # Use pre-generated thumbnail from bulk conversion
+                    temp_thumbnail_path = bulk_thumbnail_paths[i-1] if i-1 < len(bulk_thumbnail_paths) else None
+                    
+                    # Resize and save the final thumbnail
+                    if temp_thumbnail_path:
+                        if thumbnail_executor is not None:
+                            thumbnail_path = pending_thumbnails[i-1].result()
+                        else:
+                            thumbnail_path = self._process_bulk_thumbnail(temp_thumbnail_path, file_uuid)
+                    else:
+                        # Fallback to individual generation if bulk failed for this slide
+                        if verbose:
+                            print(f"    ⚠️  Using fallback thumbnail generation for slide {i}")
+                        # Per-slide conversion works from a file on disk
+                        output_file.write_bytes(pptx_bytes)
+                        self._produced_files.append(output_file)
+                        temp_thumbnail_path = thumbnail_generator.create_high_quality_thumbnail_from_pptx(
+                            str(output_file), i
+                        )
+                        if temp_thumbnail_path:
+                            thumbnail_path = self._process_and_save_thumbnail(temp_thumbnail_path, file_uuid)
+                            thumbnail_generator.cleanup_temp_thumbnail(temp_thumbnail_path)
+                        else:
+                            thumbnail_path = None
+                    
+                    if thumbnail_path:
+                        self._produced_files.append(Path(thumbnail_path))
+                        add_file_to_zip(archive, Path(thumbnail_path))
+                    
+                    # Report progress - slide completed
+                    if progress_callback:
+                        progress_callback(i, total_slides, slide_name, "completed")
+                    
+                    # Store slide metadata
+                    slide_metadata.append({
+                        'name': slide_name,
+                        'id': file_uuid,
+                        'thumbMode': '1'
+                    })
+                    
+                    if verbose:
+                        print(f"✅ {output_file.name} + {Path(thumbnail_path).name}")
                 
-                # Report progress - processing thumbnail (already generated)
+                # Generate XML metadata
                 if progress_callback:
-                    progress_callback(i, total_slides, slide_name, "creating_thumbnail")
+                    progress_callback(total_slides + 1, total_slides + 2, "XML Metadata", "creating_xml")
                 
-                # Use pre-generated thumbnail from bulk conversion
-                temp_thumbnail_path = bulk_thumbnail_paths[i-1] if i-1 < len(bulk_thumbnail_paths) else None
+                xml_path = self.xml_generator.create_xml_metadata(
+                    self.group_name, slide_metadata, self.output_dir
+                )
+                self._produced_files.append(xml_path)
+                add_file_to_zip(archive, xml_path)
                 
-                # Resize and save the final thumbnail
-                if temp_thumbnail_path:
-                    thumbnail_path = self._process_and_save_thumbnail(temp_thumbnail_path, file_uuid)
-                    # Clean up the temporary thumbnail
-                    self.thumbnail_generator.cleanup_temp_thumbnail(temp_thumbnail_path)
-                else:
-                    # Fallback to individual generation if bulk failed for this slide
-                    if self.config['verbose']:
-                        print(f"    ⚠️  Using fallback thumbnail generation for slide {i}")
-                    temp_thumbnail_path = self.thumbnail_generator.create_high_quality_thumbnail_from_pptx(
-                        str(output_file), i
-                    )
-                    if temp_thumbnail_path:
-                        thumbnail_path = self._process_and_save_thumbnail(temp_thumbnail_path, file_uuid)
-                        self.thumbnail_generator.cleanup_temp_thumbnail(temp_thumbnail_path)
-                    else:
-                        thumbnail_path = None
+                if verbose:
+                    print(f"\n📄 Created XML metadata: {xml_path.name}")
+                    print(f"   Group: {self.group_name}")
+                    print(f"   Elements: {len(slide_metadata)}")
                 
-                # Report progress - slide completed
+                # Finish the zip archive
                 if progress_callback:
-                    progress_callback(i, total_slides, slide_name, "completed")
+                    progress_callback(total_slides + 2, total_slides + 2, "Zip Archive", "creating_zip")
                 
-                # Store slide metadata
-                slide_metadata.append({
-                    'name': slide_name,
-                    'id': file_uuid,
-                    'thumbMode': '1'
-                })
-                
-                if self.config['verbose']:
-                    print(f"✅ {output_file.name} + {Path(thumbnail_path).name}")
+                if verbose:
+                    print(f"\n📦 Finalizing zip archive...")
             
-            # Generate XML metadata
-            if progress_callback:
-                progress_callback(total_slides + 1, total_slides + 2, "XML Metadata", "creating_xml")
+            finally:
+                archive.close()
+                if executor is not None:
+                    executor.shutdown()
+                if thumbnail_executor is not None:
+                    thumbnail_executor.shutdown()
+                source_bytes = None
+                package = None
             
-            xml_path = self.xml_generator.create_xml_metadata(
-                self.group_name, slide_metadata, self.output_dir
-            )
-            
-            if self.config['verbose']:
-                print(f"\n📄 Created XML metadata: {xml_path.name}")
-                print(f"   Group: {self.group_name}")
-                print(f"   Elements: {len(slide_metadata)}")
-            
-            # Create zip archive
-            if progress_callback:
-                progress_callback(total_slides + 2, total_slides + 2, "Zip Archive", "creating_zip")
-            
-            if self.config['verbose']:
-                print(f"\n📦 Creating zip archive...")
-            
-            zip_path = self._create_zip_archive()
+            self._finish_zip_archive(zip_path, len(archive.infolist()))
+            self.zip_path = zip_path
             
             # Final completion
             if progress_callback:
                 progress_callback(total_slides + 2, total_slides + 2, "Export Complete", "export_complete")
             
             # Performance summary
-            total_time = time.time() - start_time
-            if self.config['verbose']:
+            total_time = time.perf_counter() - start_time
+            if verbose:
                 print(f"\n🎉 Processing complete!")
                 print(f"⏱️  Total time: {total_time:.1f}s ({total_time/total_slides:.1f}s per slide)")
                 print(f"🚀 Performance: {total_slides/total_time:.1f} slides/second")
                 print(f"📈 High-quality thumbnails with accurate visual representation!")
             
-            return created_files
+            return slide_entries
             
         except Exception as e:
+            # Don't leave a partial archive next to the input file
+            if zip_path is not None:
+                try:
+                    zip_path.unlink()
+                except OSError:
+                    pass
+            
             # Clean up on error if we created a temporary directory
             if self.temp_dir_created:
                 try:
@@ -238,92 +396,93 @@ class PowerPointSplitter:
                     pass
             raise
     
-    def _create_single_slide_presentation(self, source_presentation, target_slide, slide_index):
+    def _create_slide_executor(
+        self,
+        total_slides: int,
+        package: 'PresentationPackage'
+    ) -> Optional[ProcessPoolExecutor]:
         """
-        Create a new presentation containing only the specified slide.
+        Create the worker pool used to write individual slide files.
+        
+        Each worker holds its own uncompressed copy of the deck, so large
+        decks get fewer workers to stay within the configured memory budget,
+        and are written in-process if even one copy doesn't fit.
         
         Args:
-            source_presentation: The original presentation
-            target_slide: The slide to extract
-            slide_index: Index of the slide in the original presentation
+            total_slides: Number of slides that will be written
+            package: The loaded source package, used to size the workers' copies
         
         Returns:
-            A new Presentation object with only the target slide
+            A process pool, or None when slides should be written in-process
         """
-        # Create a temporary copy of the original presentation
-        with tempfile.NamedTemporaryFile(suffix='.pptx', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        # Save the source presentation to temp file
-        source_presentation.save(str(temp_path))
-        
-        # Load the temp presentation
-        temp_presentation = Presentation(str(temp_path))
-        
-        # Remove all slides except the target slide
-        slides_to_remove = []
-        for i, slide in enumerate(temp_presentation.slides):
-            if i != slide_index:
-                slides_to_remove.append(i)
-        
-        # Remove slides in reverse order to avoid index shifting
-        for slide_idx in reversed(slides_to_remove):
-            rId = temp_presentation.slides._sldIdLst[slide_idx].rId
-            temp_presentation.part.drop_rel(rId)
-            del temp_presentation.slides._sldIdLst[slide_idx]
+        if not self.config['parallel_processing'] or total_slides < 2:
+            return None
         
-        # Clean up temp file
-        try:
-            temp_path.unlink()
-        except:
-            pass
+        worker_memory = self.config['worker_memory_mb'] * 1024 * 1024
+        max_workers = min(
+            self.config['max_workers'],
+            total_slides,
+            worker_memory // max(1, package.uncompressed_size())
+        )
+        if max_workers < 1:
+            return None
         
-        return temp_presentation
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_slide_worker,
+            initargs=(str(self.input_file),)
+        )
     
     def _extract_slide_name(self, slide, slide_number: int) -> str:
         """
         Extract a meaningful name from the slide.
         
         Args:
-            slide: The slide object
+            slide: Root element of the slide's XML part
             slide_number: The slide number (1-based)
             
         Returns:
             The extracted slide name
         """
-        # Try to find a title in the slide
-        for shape in slide.shapes:
-            try:
-                if hasattr(shape, 'text') and shape.text.strip():
-                    text_content = shape.text.strip()
-                    
-                    # Check if this might be a title
-                    is_likely_title = False
-                    
-                    # Check if it's a placeholder
-                    try:
-                        if hasattr(shape, 'placeholder_format'):
-                            is_likely_title = True
-                    except:
-                        pass
-                    
-                    # Or if it's short text (likely a title)
-                    if len(text_content) < 100:
-                        is_likely_title = True
-                    
-                    if is_likely_title:
-                        # Clean up the title
-                        title = ' '.join(text_content.split())
-                        if len(title) > 50:
-                            title = title[:47] + "..."
-                        return title
-            except Exception:
-                # Skip shapes that cause errors
-                continue
+        from src.core.pptx_package import slide_texts, slide_title
+        
+        # Use the title placeholder directly when the slide has one
+        title_text = (slide_title(slide) or '').strip()
+        if title_text:
+            return self._format_slide_title(title_text)
+        
+        # Otherwise use the first placeholder or short text (likely a title)
+        for text, is_placeholder in slide_texts(slide):
+            text_content = text.strip()
+            if text_content and (is_placeholder or len(text_content) < 100):
+                return self._format_slide_title(text_content)
         
         # Fallback to generic slide name
         return f"Slide {slide_number}"
     
+    @staticmethod
+    def _format_slide_title(text: str) -> str:
+        """Collapse whitespace and truncate a slide title for display."""
+        title = ' '.join(text.split())
+        if len(title) > 50:
+            title = title[:47] + "..."
+        return title
+    
+    def _process_bulk_thumbnail(self, temp_thumbnail_path: str, file_uuid: str) -> Optional[str]:
+        """
+        Save a thumbnail from the bulk conversion and remove its temporary file.
+        
+        Args:
+            temp_thumbnail_path: Path to the temporary thumbnail file
+            file_uuid: UUID for the output filename
+            
+        Returns:
+            Path to the final thumbnail file, or None if processing failed
+        """
+        thumbnail_path = self._process_and_save_thumbnail(temp_thumbnail_path, file_uuid)
+        self.thumbnail_generator.cleanup_temp_thumbnail(temp_thumbnail_path)
+        return thumbnail_path
+    
     def _process_and_save_thumbnail(self, temp_thumbnail_path: str, file_uuid: str) -> str:
         """
         Process and save the final thumbnail from a temporary thumbnail file.
@@ -339,15 +498,16 @@ class PowerPointSplitter:
             # Final thumbnail path
             final_thumbnail_path = self.output_dir / f"{file_uuid}.png"
             
-            # Resize the thumbnail to the configured height
-            resized_thumbnail_path = self.thumbnail_generator.resize_thumbnail(
+            # Resize the thumbnail straight to its final location
+            self.thumbnail_generator.resize_thumbnail(
                 temp_thumbnail_path, 
-                self.config['thumbnail_height']
+                self.config['thumbnail_height'],
+                output_path=str(final_thumbnail_path)
             )
             
-            # Move the resized thumbnail to its final location
-            import shutil
-            shutil.move(resized_thumbnail_path, str(final_thumbnail_path))
+            # Recompress it here, in the thumbnail pool when slides run in
+            # parallel, rather than while the deck is still being rendered
+            self.thumbnail_generator.optimize_thumbnail(str(final_thumbnail_path))
             
             return str(final_thumbnail_path)
             
@@ -356,88 +516,48 @@ class PowerPointSplitter:
                 print(f"Error processing thumbnail: {e}")
             return None
     
-    def _create_zip_archive(self) -> str:
+    def _finish_zip_archive(self, zip_path: Path, file_count: int) -> None:
         """
-        Create a zip archive containing all generated files, then clean up.
-        Places zip file at the same level as the input PowerPoint file.
+        Report on the completed zip archive and clean up the generated files.
         
-        Returns:
-            Path to the created zip file
+        Args:
+            zip_path: Path to the written zip file (next to the input file)
+            file_count: Number of entries written to the archive
         """
-        try:
-            # Create timestamped zip filename
-            zip_filename = generate_timestamped_filename(self.base_name, "zip")
-            
-            # Place zip file at the same level as the input file
-            zip_path = self.input_file.parent / zip_filename
-            
-            # Get all generated files to include in zip
-            files_to_zip = []
-            
-            # Add all PPTX files (individual slides)
-            files_to_zip.extend(self.output_dir.glob("*.pptx"))
-            
-            # Add all PNG files (thumbnails) 
-            files_to_zip.extend(self.output_dir.glob("*.png"))
-            
-            # Add XML metadata file
-            xml_file = self.output_dir / self.config['xml_filename']
-            if xml_file.exists():
-                files_to_zip.append(xml_file)
-            
-            if not files_to_zip:
-                if self.config['verbose']:
-                    print(f"    ⚠️  No files found to archive")
-                return None
-            
-            # Create zip archive
-            success, file_count, archive_size_mb = create_zip_archive(
-                files_to_zip, 
-                zip_path, 
-                exclude_system_files=True
-            )
-            
-            if success:
-                if self.config['verbose']:
-                    print(f"    ✅ Compressed {file_count} files")
-                    print(f"    📦 Archive size: {archive_size_mb:.1f} MB")
-                    print(f"    📁 Saved to: {zip_path}")
-                
-                # Clean up generated files now that they're archived
-                if self.config['verbose']:
-                    print(f"\n🧹 Cleaning up generated files...")
-                
-                cleanup_count = self._cleanup_generated_files()
-                
-                if self.config['verbose']:
-                    print(f"    ✅ Removed {cleanup_count} generated files")
-                    print(f"    📦 Final output: {zip_filename}")
-                
-                return str(zip_path)
-            else:
-                raise Exception("Failed to create zip archive")
-                
-        except Exception as e:
-            if self.config['verbose']:
-                print(f"    ❌ Error creating zip archive: {e}")
-            return None
+        if self.config['verbose']:
+            print(f"    ✅ Compressed {file_count} files")
+            print(f"    📦 Archive size: {get_file_size_mb(zip_path):.1f} MB")
+            print(f"    📁 Saved to: {zip_path}")
+        
+        # Clean up generated files now that they're archived
+        if self.config['verbose']:
+            print(f"\n🧹 Cleaning up generated files...")
+        
+        cleanup_count = self._cleanup_generated_files()
+        
+        if self.config['verbose']:
+            print(f"    ✅ Removed {cleanup_count} generated files")
+            print(f"    📦 Final output: {zip_path.name}")
     
     def _cleanup_generated_files(self) -> int:
         """
         Remove all generated files (PPTX, PNG, XML) and the temporary directory.
         
+        A temporary directory of our own is removed in the background, since
+        nothing else writes into it and the archive is already complete.
+        
         Returns:
-            Number of files removed
+            Number of files removed (or scheduled for removal)
         """
-        # Get all files to remove
-        files_to_remove = []
-        file_patterns = ["*.pptx", "*.png", "*.xml"]
-        
-        for pattern in file_patterns:
-            files_to_remove.extend(self.output_dir.glob(pattern))
+        if self.temp_dir_created:
+            removed_count = len(self._produced_files)
+            self._produced_files = []
+            schedule_cleanup([self.output_dir], verbose=self.config['verbose'])
+            return removed_count
         
-        # Remove files
-        removed_count = cleanup_files(files_to_remove, verbose=self.config['verbose'])
+        # Remove the files this run generated
+        removed_count = cleanup_files(self._produced_files, verbose=self.config['verbose'])
+        self._produced_files = []
         
         # Clean up directory
         cleanup_directory(
@@ -2,69 +2,335 @@
 Thumbnail generation module for Export for My Efficient Elements.
 
 This module handles thumbnail generation using a reliable two-step approach:
-1. PowerPoint to PDF conversion (using Microsoft PowerPoint via AppleScript)
+1. PowerPoint to PDF conversion (using Microsoft PowerPoint via AppleScript,
+   or LibreOffice in headless mode)
 2. PDF to PNG conversion (using pdf2image library)
 
 This approach provides high-quality, accurate slide thumbnails.
 """
 
+import hashlib
 import os
+import shutil
+import stat
+import struct
 import subprocess
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+try:
+    from pdf2image import convert_from_path
+except ImportError:
+    # Optional: the pdf2image method is simply not offered without it
+    convert_from_path = None
 
 from config.settings import get_processing_config
 
 
+# Placeholder thumbnail color, used when no conversion method succeeds
+FALLBACK_THUMBNAIL_COLOR = (46, 134, 193)
+
+# PNG files start with this signature, followed by the IHDR chunk holding the size
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Invariant pdftoppm arguments: PNG output (the size is set per generator)
+PDFTOPPM_PNG_ARGS = ('pdftoppm', '-png')
+
+# Parallel pdftoppm processes for multi-page PDFs, leaving one core for the caller
+RENDER_THREAD_COUNT = max(1, (os.cpu_count() or 2) - 1)
+
+# Lossless PNG recompression, used when oxipng is installed: pdftoppm writes
+# quickly-compressed PNGs, and smaller thumbnails mean a smaller download.
+# Thumbnails below the minimum size gain too little to be worth a process
+OXIPNG_ARGS = ('oxipng', '--opt', '2', '--strip', 'safe', '--quiet')
+OXIPNG_MIN_BYTES = 16 * 1024
+
+
+@lru_cache(maxsize=None)
+def _find_executable(name: str) -> Optional[str]:
+    """Return the absolute path of a command-line tool, or None if it isn't on PATH."""
+    # Only stats PATH entries, so checking for a tool never starts a process
+    return shutil.which(name)
+
+
+def _resolve_executable(name: str) -> str:
+    """Return the absolute path of a command-line tool, or the name if not found."""
+    return _find_executable(name) or name
+
+
+def _run_tool(cmd: Sequence[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run an external conversion tool.
+    
+    With an absolute executable path and close_fds=False, CPython starts the
+    child with posix_spawn instead of fork+exec, which stays cheap however
+    large this process grows. Python's own file descriptors are already
+    non-inheritable, so nothing leaks into the child.
+    """
+    argv = [_resolve_executable(cmd[0]), *cmd[1:]]
+    return subprocess.run(argv, stdin=subprocess.DEVNULL, close_fds=False, **kwargs)
+
+
+def _tool_responds(cmd: Sequence[str], timeout: float) -> bool:
+    """Check whether a command-line tool runs and exits successfully."""
+    try:
+        return _run_tool(cmd, capture_output=True, timeout=timeout).returncode == 0
+    except Exception:
+        return False
+
+
+def _page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """Split pages 1..page_count into at most `parts` contiguous (first, last) ranges."""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    first = 1
+    for part in range(parts):
+        last = first + size - 1 + (1 if part < extra else 0)
+        if last >= first:
+            ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
+def _new_temp_path(suffix: str) -> str:
+    """
+    Reserve a unique temporary file path.
+    
+    The empty file is created and its descriptor closed straight away, which
+    avoids wrapping it in a file object that is only opened to be discarded.
+    """
+    fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix='ee_thumb_')
+    os.close(fd)
+    return temp_path
+
+
+def _rendered_pages(directory: str, prefix: str) -> List[str]:
+    """
+    List the page images pdftoppm wrote as <prefix>-<page>.png, in page order.
+    
+    Pages are sorted by their parsed number rather than by name, so the
+    order holds whatever zero padding pdftoppm used.
+    """
+    pages = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            stem, _, page = entry.name[:-len('.png')].rpartition('-')
+            if entry.name.endswith('.png') and stem == prefix and page.isdigit():
+                pages.append((int(page), entry.path))
+    pages.sort()
+    return [path for _, path in pages]
+
+
+def _keep_rendered_png(rendered_path: str) -> str:
+    """
+    Move a rendered PNG out of its scratch directory into its own temporary file.
+    
+    Both live in the system temp directory, so this is a rename rather than
+    a copy of the image data.
+    """
+    png_path = _new_temp_path('.png')
+    os.replace(rendered_path, png_path)
+    return png_path
+
+
+def _quiet_unlink(path: Optional[str]) -> None:
+    """Remove a temporary file, ignoring a missing path or file."""
+    # One unlink call instead of an exists() check followed by unlink()
+    if path:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _file_digest(file_path: str) -> str:
+    """
+    Hash a file's contents for use as a cache key.
+    
+    BLAKE2b is faster than SHA-256 in software, and reading in chunks keeps
+    large decks out of memory.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    """
+    Hard-link a file (metadata only), copying it when linking isn't possible.
+    
+    Linking fails across filesystems or if the destination already exists.
+    Removing either name later leaves the other intact.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _ensure_private_dir(directory: str) -> bool:
+    """
+    Create a directory only the current user can access, or check an existing one.
+    
+    A symlink, a non-directory or a directory owned by another user is
+    rejected, since anything cached there could be read or planted by
+    someone else.
+    
+    Returns:
+        True if the directory exists and is private to the current user
+    """
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        dir_stat = os.lstat(directory)
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return False
+        if hasattr(os, 'getuid'):
+            if dir_stat.st_uid != os.getuid():
+                return False
+            if dir_stat.st_mode & 0o077:
+                os.chmod(directory, 0o700)
+    except OSError:
+        return False
+    return True
+
+
+def _directory_size(directory: str) -> int:
+    """Total size in bytes of the files directly inside a directory."""
+    total = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _prune_thumbnail_cache(cache_root: Path, max_bytes: int, max_age: float) -> None:
+    """
+    Evict thumbnail cache entries beyond a total size or older than max_age seconds.
+    
+    Entries are dated by their directory's mtime, which a cache hit
+    refreshes, so the least recently used go first. Stat index files are
+    removed along with the entries they point to, or once they are older
+    than max_age themselves. Best effort: errors leave entries in place.
+    """
+    now = time.time()
+    entries = []
+    try:
+        with os.scandir(cache_root) as it:
+            for entry in it:
+                if entry.name.startswith('.') or entry.name == 'by_stat':
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    entry_mtime = entry.stat(follow_symlinks=False).st_mtime
+                    entries.append((entry_mtime, entry.path, entry.name))
+    except OSError:
+        return
+    
+    # Newest first, so the size limit is spent on the most recently used
+    entries.sort(reverse=True)
+    kept_hashes = set()
+    total = 0
+    for entry_mtime, entry_path, entry_name in entries:
+        try:
+            total += _directory_size(entry_path)
+        except OSError:
+            continue
+        if total > max_bytes or now - entry_mtime > max_age:
+            shutil.rmtree(entry_path, ignore_errors=True)
+        else:
+            kept_hashes.add(entry_name.rpartition('_')[0])
+    
+    try:
+        with os.scandir(cache_root / 'by_stat') as it:
+            for entry in it:
+                try:
+                    too_old = now - entry.stat(follow_symlinks=False).st_mtime > max_age
+                    # Staging files still being written are left alone until they are old
+                    if too_old or (not entry.name.startswith('.')
+                                   and Path(entry.path).read_text() not in kept_hashes):
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
 class SlideThumbnailGenerator:
     """High-quality thumbnail generator using PowerPoint to PDF to PNG conversion."""
     
+    # Conversion methods detected on this system, shared by all instances
+    _cached_methods: Optional[List[str]] = None
+    
+    # Encoded placeholder PNGs by size, rendered on first use and shared by all instances
+    _fallback_pngs: Dict[int, bytes] = {}
+    
     def __init__(self):
         self.config = get_processing_config()
         
+        # Slides are rasterized straight at thumbnail size: the longest side
+        # is scaled to the thumbnail height, the same bound `sips -Z` applies
+        self.render_size: int = self.config['thumbnail_height']
+        
         # Check available conversion methods
         self.conversion_methods = self._detect_conversion_methods()
         if self.config['verbose']:
             print(f"🔍 Available conversion methods: {', '.join(self.conversion_methods)}")
+        
+        # Methods that last succeeded for each conversion step, tried first next time
+        self.resolved_pdf_method: Optional[str] = None
+        self.resolved_png_method: Optional[str] = None
     
-    def _detect_conversion_methods(self) -> List[str]:
-        """Detect which conversion methods are available on this system."""
+    @classmethod
+    def _detect_conversion_methods(cls) -> List[str]:
+        """
+        Detect which conversion methods are available on this system.
+        
+        The subprocess probes only run once per process; later calls return
+        a copy of the cached result.
+        """
+        if cls._cached_methods is None:
+            cls._cached_methods = cls._probe_conversion_methods()
+        return list(cls._cached_methods)
+    
+    @staticmethod
+    def _probe_conversion_methods() -> List[str]:
+        """Probe the system for each supported conversion method."""
         methods = []
         
-        # Check for Microsoft PowerPoint (AppleScript method)
-        try:
-            result = subprocess.run(['osascript', '-e', 'tell application "Microsoft PowerPoint" to get version'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                methods.append('powerpoint_applescript')
-        except:
-            pass
+        # Microsoft PowerPoint and Keynote (AppleScript methods). Asking each app
+        # for its version starts an osascript process (hundreds of milliseconds
+        # on a cold system), so the probes run concurrently - and not at all
+        # where there is no osascript
+        if _find_executable('osascript'):
+            app_probes = {
+                'powerpoint_applescript': ['osascript', '-e', 'tell application "Microsoft PowerPoint" to get version'],
+                'keynote_applescript': ['osascript', '-e', 'tell application "Keynote" to get version'],
+            }
+            with ThreadPoolExecutor(max_workers=len(app_probes)) as pool:
+                available = list(pool.map(lambda cmd: _tool_responds(cmd, 5), app_probes.values()))
+            methods.extend(method for method, ok in zip(app_probes, available) if ok)
         
-        # Check for Keynote (AppleScript method)
-        try:
-            result = subprocess.run(['osascript', '-e', 'tell application "Keynote" to get version'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                methods.append('keynote_applescript')
-        except:
-            pass
+        # Check for LibreOffice (headless conversion, no GUI app or Apple Events)
+        if _find_executable('soffice'):
+            methods.append('libreoffice')
         
         # Check for pdf2image library
-        try:
-            from pdf2image import convert_from_path
+        if convert_from_path is not None:
             methods.append('pdf2image')
-        except ImportError:
-            pass
         
         # Check for Poppler (pdftoppm)
-        try:
-            result = subprocess.run(['pdftoppm', '-h'], capture_output=True, timeout=3)
-            if result.returncode == 0:
-                methods.append('poppler')
-        except:
-            pass
+        if _find_executable('pdftoppm'):
+            methods.append('poppler')
         
         # Always available simple fallback
         methods.append('simple_fallback')
@@ -85,27 +351,149 @@ class SlideThumbnailGenerator:
         Returns:
             List of paths to generated thumbnail files (one per slide), or None for failed slides
         """
+        # Reuse the thumbnails of an identical deck rendered earlier
+        cache_dir = self._thumbnail_cache_dir(pptx_path)
+        cached_paths = self._load_cached_thumbnails(cache_dir, total_slides)
+        if cached_paths:
+            if self.config['verbose']:
+                print(f"    ✅ Reused {total_slides} cached thumbnails")
+            return cached_paths
+        
         if self.config['verbose']:
             print(f"    🎨 Generating {total_slides} thumbnails using optimized bulk conversion...")
         
-        # Try bulk PowerPoint to PDF to PNG conversion
+        # Try bulk PowerPoint to PDF to PNG conversion (one conversion for the whole deck)
         thumbnail_paths = self._convert_ppt_to_pngs_bulk(pptx_path, total_slides)
-        if thumbnail_paths:
+        if any(thumbnail_paths):
             if self.config['verbose']:
                 print(f"    ✅ Used bulk PowerPoint to PNG conversion for {len([p for p in thumbnail_paths if p])} thumbnails")
+            if all(thumbnail_paths):
+                self._store_cached_thumbnails(cache_dir, thumbnail_paths)
             return thumbnail_paths
         
-        # Fallback to individual conversion for each slide
+        # The deck could not be converted as a whole, so converting it again once
+        # per slide would only repeat the same failure - use placeholders instead
         if self.config['verbose']:
-            print(f"    ⚠️  Bulk conversion failed, falling back to individual slide conversion...")
+            print(f"    ⚠️  Bulk conversion failed, using simple fallback thumbnails...")
+        
+        return [
+            self._create_simple_fallback_thumbnail(pptx_path, slide_num)
+            for slide_num in range(1, total_slides + 1)
+        ]
+    
+    def _thumbnail_cache_dir(self, pptx_path: str) -> Optional[Path]:
+        """
+        Get the cache entry directory for a deck's rendered thumbnails.
         
-        fallback_thumbnails = []
-        for slide_num in range(1, total_slides + 1):
-            thumbnail_path = self.create_high_quality_thumbnail_from_pptx(pptx_path, slide_num)
-            fallback_thumbnails.append(thumbnail_path)
+        Entries are keyed by a hash of the deck's contents and the render
+        size, so renamed or re-uploaded copies of a deck still hit. Hashing
+        reads the whole deck, so the hash is remembered under the file's
+        size, mtime and inode; an unchanged file is looked up with one stat.
         
-        return fallback_thumbnails
-
+        Returns:
+            The entry directory (which may not exist yet), or None if caching is disabled
+        """
+        cache_root = self.config['thumbnail_cache_dir']
+        if not cache_root or not _ensure_private_dir(cache_root):
+            return None
+        
+        try:
+            file_stat = os.stat(pptx_path)
+        except OSError:
+            return None
+        index_file = Path(cache_root) / 'by_stat' / (
+            f"{file_stat.st_size}_{file_stat.st_mtime_ns}_{file_stat.st_ino}"
+        )
+        
+        try:
+            content_hash = index_file.read_text()
+        except OSError:
+            try:
+                content_hash = _file_digest(pptx_path)
+            except OSError:
+                return None
+            self._write_cache_index(index_file, content_hash)
+        
+        return Path(cache_root) / f"{content_hash}_{self.render_size}px"
+    
+    @staticmethod
+    def _write_cache_index(index_file: Path, content_hash: str) -> None:
+        """Remember a deck's content hash under its stat key (best effort, atomic)."""
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=index_file.parent, prefix='.')
+            with os.fdopen(fd, 'w') as temp_file:
+                temp_file.write(content_hash)
+            os.replace(temp_path, index_file)
+        except OSError:
+            pass
+    
+    def _load_cached_thumbnails(self, cache_dir: Optional[Path], total_slides: int) -> Optional[List[str]]:
+        """
+        Get temporary copies of a deck's cached thumbnails.
+        
+        Callers delete the thumbnails they are given, so each one is handed
+        out as a fresh hard link rather than the cached file itself.
+        
+        Returns:
+            One thumbnail path per slide, or None unless every slide is cached
+        """
+        if cache_dir is None or total_slides < 1:
+            return None
+        
+        cached_files = [cache_dir / f"{i}.png" for i in range(total_slides)]
+        if not all(cached_file.exists() for cached_file in cached_files):
+            return None
+        
+        png_paths = []
+        try:
+            for cached_file in cached_files:
+                png_path = _new_temp_path('.png')
+                os.unlink(png_path)
+                png_paths.append(png_path)
+                _link_or_copy(cached_file, png_path)
+        except OSError:
+            for png_path in png_paths:
+                self.cleanup_temp_thumbnail(png_path)
+            return None
+        
+        # Mark the entry as recently used, so pruning evicts it last
+        try:
+            os.utime(cache_dir)
+        except OSError:
+            pass
+        return png_paths
+    
+    def _store_cached_thumbnails(self, cache_dir: Optional[Path], thumbnail_paths: List[str]) -> None:
+        """
+        Add a deck's rendered thumbnails to the cache.
+        
+        The entry is assembled in a staging directory and renamed into place,
+        so a concurrent reader never sees a partial entry. The cache is then
+        pruned back to its size and age limits.
+        """
+        if cache_dir is None or cache_dir.exists():
+            return
+        
+        staging_dir = None
+        try:
+            cache_dir.parent.mkdir(parents=True, exist_ok=True)
+            staging_dir = tempfile.mkdtemp(dir=cache_dir.parent, prefix='.staging_')
+            for i, thumbnail_path in enumerate(thumbnail_paths):
+                _link_or_copy(thumbnail_path, os.path.join(staging_dir, f"{i}.png"))
+            os.rename(staging_dir, cache_dir)
+        except OSError:
+            # Caching is best effort (another process may have stored this deck first)
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            return
+        
+        _prune_thumbnail_cache(
+            cache_dir.parent,
+            self.config['thumbnail_cache_max_mb'] * 1024 * 1024,
+            self.config['thumbnail_cache_max_age_days'] * 24 * 60 * 60
+        )
+    
     def create_high_quality_thumbnail_from_pptx(self, pptx_path: str, slide_number: int) -> Optional[str]:
         """
         Create a high-quality thumbnail from PPTX file using PowerPoint to PDF to PNG conversion.
@@ -146,11 +534,7 @@ class SlideThumbnailGenerator:
             return png_path
         finally:
             # Clean up temporary PDF file
-            try:
-                if pdf_path and Path(pdf_path).exists():
-                    Path(pdf_path).unlink()
-            except:
-                pass
+            _quiet_unlink(pdf_path)
     
     def _convert_ppt_to_pngs_bulk(self, pptx_path: str, total_slides: int) -> List[Optional[str]]:
         """Convert PPTX to multiple PNGs using optimized bulk conversion."""
@@ -166,75 +550,116 @@ class SlideThumbnailGenerator:
             return png_paths
         finally:
             # Clean up temporary PDF file
-            try:
-                if pdf_path and Path(pdf_path).exists():
-                    Path(pdf_path).unlink()
-            except:
-                pass
+            _quiet_unlink(pdf_path)
+    
+    def _methods_to_try(self, candidates: List[str], resolved_method: Optional[str]) -> List[str]:
+        """
+        Order the available candidate methods, putting the last successful one first.
+        
+        Args:
+            candidates: Method names in order of preference
+            resolved_method: Method that succeeded on a previous call, if any
+            
+        Returns:
+            Available methods in the order they should be tried
+        """
+        methods = [method for method in candidates if method in self.conversion_methods]
+        if resolved_method in methods:
+            methods.remove(resolved_method)
+            methods.insert(0, resolved_method)
+        return methods
     
     def _convert_ppt_to_pdf(self, pptx_path: str) -> Optional[str]:
         """Convert PowerPoint to PDF using the best available method."""
         
-        # Try Microsoft PowerPoint via AppleScript first
-        if 'powerpoint_applescript' in self.conversion_methods:
-            pdf_path = self._convert_ppt_to_pdf_applescript_powerpoint(pptx_path)
-            if pdf_path:
-                return pdf_path
+        # Microsoft PowerPoint via AppleScript first, then Keynote, then LibreOffice
+        converters = {
+            'powerpoint_applescript': self._convert_ppt_to_pdf_applescript_powerpoint,
+            'keynote_applescript': self._convert_ppt_to_pdf_applescript_keynote,
+            'libreoffice': self._convert_ppt_to_pdf_libreoffice,
+        }
         
-        # Try Keynote via AppleScript as fallback
-        if 'keynote_applescript' in self.conversion_methods:
-            pdf_path = self._convert_ppt_to_pdf_applescript_keynote(pptx_path)
+        for method in self._methods_to_try(list(converters), self.resolved_pdf_method):
+            pdf_path = converters[method](pptx_path)
             if pdf_path:
+                self.resolved_pdf_method = method
                 return pdf_path
         
         return None
     
     def _convert_ppt_to_pdf_applescript_powerpoint(self, pptx_path: str) -> Optional[str]:
         """Convert PowerPoint to PDF using Microsoft PowerPoint via AppleScript."""
+        return self._convert_ppts_to_pdf_applescript_powerpoint([pptx_path])[0]
+    
+    def _convert_ppts_to_pdf_applescript_powerpoint(self, pptx_paths: Sequence[str]) -> List[Optional[str]]:
+        """
+        Convert several decks to PDF in one Microsoft PowerPoint AppleScript run.
+        
+        Every osascript run sets up its own Apple Events session, so a batch
+        pays that cost once instead of once per deck. PowerPoint itself stays
+        open between decks; a deck that fails is skipped without stopping
+        the rest.
+        
+        Args:
+            pptx_paths: Paths to the PPTX files
+        
+        Returns:
+            Path to each deck's PDF, or None for decks that failed
+        """
+        pdf_paths = []
+        converted = False
         
         try:
-            # Create temporary PDF file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-                pdf_path = temp_file.name
+            script_blocks = []
+            for pptx_path in pptx_paths:
+                # Create temporary PDF file
+                pdf_path = _new_temp_path('.pdf')
+                pdf_paths.append(pdf_path)
+                
+                script_blocks.append(f'''
+                try
+                    open POSIX file "{pptx_path}"
+                    set thePresentation to active presentation
+                    save thePresentation in POSIX file "{pdf_path}" as save as PDF
+                    close thePresentation
+                end try''')
             
-            # AppleScript to convert PPT to PDF using PowerPoint
+            # AppleScript to convert each PPT to PDF using PowerPoint
             applescript = f'''
-            tell application "Microsoft PowerPoint"
-                open POSIX file "{pptx_path}"
-                set thePresentation to active presentation
-                save thePresentation in POSIX file "{pdf_path}" as save as PDF
-                close thePresentation
+            tell application "Microsoft PowerPoint"{''.join(script_blocks)}
             end tell
             '''
             
             # Run AppleScript
-            result = subprocess.run(
+            result = _run_tool(
                 ["osascript", "-e", applescript],
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=60 * len(pptx_paths)
             )
-            
-            if result.returncode == 0 and Path(pdf_path).exists():
-                return pdf_path
+            converted = result.returncode == 0
+        
+        except Exception:
+            pass
+        
+        results = []
+        for pdf_path in pdf_paths:
+            # The temporary file is empty unless PowerPoint saved the PDF over it
+            if converted and os.path.getsize(pdf_path) > 0:
+                results.append(pdf_path)
             else:
                 # Clean up failed attempt
-                try:
-                    Path(pdf_path).unlink()
-                except:
-                    pass
-                return None
-                
-        except Exception:
-            return None
+                _quiet_unlink(pdf_path)
+                results.append(None)
+        
+        return results + [None] * (len(pptx_paths) - len(results))
     
     def _convert_ppt_to_pdf_applescript_keynote(self, pptx_path: str) -> Optional[str]:
         """Convert PowerPoint to PDF using Keynote via AppleScript."""
         
         try:
             # Create temporary PDF file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-                pdf_path = temp_file.name
+            pdf_path = _new_temp_path('.pdf')
             
             # AppleScript to convert PPT to PDF using Keynote
             applescript = f'''
@@ -247,39 +672,95 @@ class SlideThumbnailGenerator:
             '''
             
             # Run AppleScript
-            result = subprocess.run(
+            result = _run_tool(
                 ["osascript", "-e", applescript],
                 capture_output=True,
                 text=True,
                 timeout=60
             )
             
-            if result.returncode == 0 and Path(pdf_path).exists():
+            # The temporary file is empty unless Keynote exported the PDF over it
+            if result.returncode == 0 and os.path.getsize(pdf_path) > 0:
                 return pdf_path
             else:
                 # Clean up failed attempt
-                try:
-                    Path(pdf_path).unlink()
-                except:
-                    pass
+                _quiet_unlink(pdf_path)
                 return None
                 
         except Exception:
             return None
     
+    def _convert_ppt_to_pdf_libreoffice(self, pptx_path: str) -> Optional[str]:
+        """Convert PowerPoint to PDF using LibreOffice in headless mode."""
+        return self._convert_ppts_to_pdf_libreoffice([pptx_path])[0]
+    
+    def _convert_ppts_to_pdf_libreoffice(self, pptx_paths: Sequence[str]) -> List[Optional[str]]:
+        """
+        Convert several decks to PDF in one headless LibreOffice run.
+        
+        Starting LibreOffice takes seconds, so a batch pays that once instead
+        of once per deck. Each run gets its own user profile: LibreOffice hands
+        a conversion to any instance already running on the same profile, so a
+        shared one would make concurrent runs (e.g. two GUI sessions) interfere.
+        
+        Args:
+            pptx_paths: Paths to the PPTX files
+        
+        Returns:
+            Path to each deck's PDF, or None for decks that failed
+        """
+        results: List[Optional[str]] = [None] * len(pptx_paths)
+        remaining = list(range(len(pptx_paths)))
+        
+        while remaining:
+            # LibreOffice names each PDF after its input file, so decks
+            # sharing a file name go into separate runs
+            batch, deferred, stems = [], [], set()
+            for index in remaining:
+                stem = Path(pptx_paths[index]).stem
+                (deferred if stem in stems else batch).append(index)
+                stems.add(stem)
+            remaining = deferred
+            
+            # A failed run only loses its own batch, not the deferred ones
+            try:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    profile_uri = (Path(temp_dir) / 'profile').as_uri()
+                    _run_tool(
+                        ["soffice", f"-env:UserInstallation={profile_uri}", "--headless",
+                         "--convert-to", "pdf", "--outdir", temp_dir]
+                        + [str(pptx_paths[index]) for index in batch],
+                        capture_output=True,
+                        text=True,
+                        timeout=120 * len(batch)
+                    )
+                    
+                    # The exit status covers the whole run, so check each deck's PDF
+                    for index in batch:
+                        converted_pdf = Path(temp_dir) / f"{Path(pptx_paths[index]).stem}.pdf"
+                        if converted_pdf.exists() and converted_pdf.stat().st_size > 0:
+                            # Move the PDF out before the directory is removed
+                            pdf_path = _new_temp_path('.pdf')
+                            os.replace(converted_pdf, pdf_path)
+                            results[index] = pdf_path
+            except Exception:
+                pass
+        
+        return results
+    
     def _convert_pdf_to_png(self, pdf_path: str, slide_number: int) -> Optional[str]:
         """Convert PDF to PNG using the best available method."""
         
-        # Try pdf2image first (most reliable)
-        if 'pdf2image' in self.conversion_methods:
-            png_path = self._convert_pdf_to_png_pdf2image(pdf_path, slide_number)
-            if png_path:
-                return png_path
+        # pdf2image first (most reliable), Poppler as fallback
+        converters = {
+            'pdf2image': self._convert_pdf_to_png_pdf2image,
+            'poppler': self._convert_pdf_to_png_poppler,
+        }
         
-        # Try Poppler as fallback
-        if 'poppler' in self.conversion_methods:
-            png_path = self._convert_pdf_to_png_poppler(pdf_path, slide_number)
+        for method in self._methods_to_try(list(converters), self.resolved_png_method):
+            png_path = converters[method](pdf_path, slide_number)
             if png_path:
+                self.resolved_png_method = method
                 return png_path
         
         return None
@@ -287,16 +768,16 @@ class SlideThumbnailGenerator:
     def _convert_pdf_to_pngs_bulk(self, pdf_path: str, total_slides: int) -> List[Optional[str]]:
         """Convert PDF to multiple PNGs using the best available method."""
         
-        # Try pdf2image first (most reliable)
-        if 'pdf2image' in self.conversion_methods:
-            png_paths = self._convert_pdf_to_pngs_bulk_pdf2image(pdf_path, total_slides)
-            if png_paths:
-                return png_paths
+        # pdf2image first (most reliable), Poppler as fallback
+        converters = {
+            'pdf2image': self._convert_pdf_to_pngs_bulk_pdf2image,
+            'poppler': self._convert_pdf_to_pngs_bulk_poppler,
+        }
         
-        # Try Poppler as fallback
-        if 'poppler' in self.conversion_methods:
-            png_paths = self._convert_pdf_to_pngs_bulk_poppler(pdf_path, total_slides)
-            if png_paths:
+        for method in self._methods_to_try(list(converters), self.resolved_png_method):
+            png_paths = converters[method](pdf_path, total_slides)
+            if any(png_paths):
+                self.resolved_png_method = method
                 return png_paths
         
         return [None] * total_slides
@@ -305,23 +786,20 @@ class SlideThumbnailGenerator:
         """Convert PDF to multiple PNGs using pdf2image library."""
         
         try:
-            from pdf2image import convert_from_path
-            
-            # Convert all PDF pages to images (300 DPI for high quality)
-            images = convert_from_path(pdf_path, dpi=300, fmt='PNG')
-            
-            if not images:
-                return [None] * total_slides
-            
-            png_paths = []
-            for i, image in enumerate(images):
-                # Create temporary PNG file for each slide
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                    png_path = temp_file.name
+            with tempfile.TemporaryDirectory() as temp_dir:
+                # Render all PDF pages at thumbnail size straight to PNG files:
+                # each page is encoded once by pdftoppm and never held in memory
+                # as a bitmap. Page ranges render in parallel
+                rendered_paths = convert_from_path(
+                    pdf_path, size=self.render_size, fmt='png', output_folder=temp_dir,
+                    paths_only=True, thread_count=RENDER_THREAD_COUNT
+                )
                 
-                # Save the image
-                image.save(png_path, 'PNG')
-                png_paths.append(png_path)
+                if not rendered_paths:
+                    return [None] * total_slides
+                
+                # Move each slide's PNG out before the directory is removed
+                png_paths = [_keep_rendered_png(path) for path in rendered_paths[:total_slides]]
             
             # Pad with None if we have fewer images than expected slides
             while len(png_paths) < total_slides:
@@ -329,11 +807,7 @@ class SlideThumbnailGenerator:
             
             return png_paths[:total_slides]  # Return exactly the number of slides expected
             
-        except ImportError:
-            # pdf2image not available
-            pass
         except Exception:
-            # Other errors
             pass
         
         return [None] * total_slides
@@ -346,31 +820,29 @@ class SlideThumbnailGenerator:
             with tempfile.TemporaryDirectory() as temp_dir:
                 output_prefix = Path(temp_dir) / "slide"
                 
-                # Use pdftoppm to convert all PDF pages to PNG
-                cmd = [
-                    "pdftoppm",
-                    "-png",
-                    "-r", "300",  # 300 DPI resolution
-                    pdf_path,
-                    str(output_prefix)
+                # pdftoppm renders on a single thread, so split the pages into
+                # contiguous ranges and convert each range in its own process.
+                # Output names carry the page number, so the ranges share a prefix
+                commands = [
+                    PDFTOPPM_PNG_ARGS + (
+                        '-scale-to', str(self.render_size),
+                        '-f', str(first), '-l', str(last),
+                        pdf_path, str(output_prefix)
+                    )
+                    for first, last in _page_ranges(total_slides, RENDER_THREAD_COUNT)
                 ]
+                with ThreadPoolExecutor(max_workers=max(1, len(commands))) as pool:
+                    results = list(pool.map(
+                        lambda cmd: _run_tool(cmd, capture_output=True, text=True, timeout=120),
+                        commands
+                    ))
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-                
-                if result.returncode == 0:
+                if any(result.returncode == 0 for result in results):
                     # Find generated PNG files (they'll be named slide-01.png, slide-02.png, etc.)
-                    png_files = sorted(list(Path(temp_dir).glob("slide-*.png")))
+                    png_files = _rendered_pages(temp_dir, "slide")
                     
-                    png_paths = []
-                    for png_file in png_files:
-                        # Create permanent temporary file
-                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                            png_path = temp_file.name
-                        
-                        # Copy the generated PNG
-                        import shutil
-                        shutil.copy2(png_file, png_path)
-                        png_paths.append(png_path)
+                    # Move the generated PNGs out before the directory is removed
+                    png_paths = [_keep_rendered_png(png_file) for png_file in png_files]
                     
                     # Pad with None if we have fewer images than expected slides
                     while len(png_paths) < total_slides:
@@ -386,121 +858,82 @@ class SlideThumbnailGenerator:
     def _convert_pdf_to_png_pdf2image(self, pdf_path: str, slide_number: int) -> Optional[str]:
         """Convert PDF to PNG using pdf2image library."""
         
+        # Render the first page (single slide presentation) at thumbnail size
+        # straight over a reserved temporary file, so no scratch directory is
+        # created and removed per slide
+        png_path = _new_temp_path('.png')
         try:
-            from pdf2image import convert_from_path
-            
-            # Convert PDF pages to images (300 DPI for high quality)
-            images = convert_from_path(pdf_path, dpi=300, fmt='PNG')
+            convert_from_path(
+                pdf_path, size=self.render_size, fmt='png',
+                output_folder=os.path.dirname(png_path), output_file=Path(png_path).stem,
+                paths_only=True, single_file=True
+            )
             
-            if images:
-                # Get the first page (single slide presentation)
-                image = images[0]
-                
-                # Create temporary PNG file
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                    png_path = temp_file.name
-                
-                # Save the image
-                image.save(png_path, 'PNG')
+            # The reserved file stays empty unless the page was rendered over it
+            if os.path.getsize(png_path) > 0:
                 return png_path
             
-        except ImportError:
-            # pdf2image not available
-            pass
         except Exception:
-            # Other errors
             pass
         
+        _quiet_unlink(png_path)
         return None
     
     def _convert_pdf_to_png_poppler(self, pdf_path: str, slide_number: int) -> Optional[str]:
         """Convert PDF to PNG using Poppler utilities (pdftoppm)."""
         
+        # -singlefile writes exactly <prefix>.png, so render straight over a
+        # reserved temporary file instead of into a scratch directory
+        png_path = _new_temp_path('.png')
         try:
-            # Create temporary directory for output
-            with tempfile.TemporaryDirectory() as temp_dir:
-                output_prefix = Path(temp_dir) / "slide"
-                
-                # Use pdftoppm to convert PDF to PNG
-                cmd = [
-                    "pdftoppm",
-                    "-png",
-                    "-r", "300",  # 300 DPI resolution
-                    "-singlefile",  # Single file output
-                    pdf_path,
-                    str(output_prefix)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            cmd = PDFTOPPM_PNG_ARGS + (
+                "-scale-to", str(self.render_size), "-singlefile", pdf_path, png_path[:-len('.png')]
+            )
+            
+            result = _run_tool(cmd, capture_output=True, text=True, timeout=60)
+            
+            # The reserved file stays empty unless pdftoppm wrote the page over it
+            if result.returncode == 0 and os.path.getsize(png_path) > 0:
+                return png_path
                 
-                if result.returncode == 0:
-                    # Find generated PNG file
-                    png_files = list(Path(temp_dir).glob("*.png"))
-                    if png_files:
-                        source_file = png_files[0]
-                        
-                        # Create permanent temporary file
-                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                            png_path = temp_file.name
-                        
-                        # Copy the generated PNG
-                        import shutil
-                        shutil.copy2(source_file, png_path)
-                        return png_path
-                        
         except Exception:
             pass
         
+        _quiet_unlink(png_path)
         return None
     
     def _create_simple_fallback_thumbnail(self, pptx_path: str, slide_number: int) -> str:
         """
-        Create a simple fallback thumbnail without external dependencies.
+        Create a simple fallback thumbnail without external tools.
         
         This creates a basic colored square as a placeholder thumbnail.
         While not visually representative, it ensures the process continues.
         """
-        # Create a simple 1x1 pixel PNG programmatically
-        # This is a minimal PNG file that represents a colored square
-        
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            # Write a minimal PNG file (1x1 blue pixel)
-            # PNG signature + IHDR + IDAT + IEND chunks
-            png_data = bytes([
-                # PNG signature
-                0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,
-                # IHDR chunk (13 bytes)
-                0x00, 0x00, 0x00, 0x0D,  # Length
-                0x49, 0x48, 0x44, 0x52,  # Type: IHDR
-                0x00, 0x00, 0x00, 0x78,  # Width: 120
-                0x00, 0x00, 0x00, 0x78,  # Height: 120  
-                0x08, 0x02,              # Bit depth: 8, Color type: 2 (RGB)
-                0x00, 0x00, 0x00,        # Compression, Filter, Interlace
-                0x8D, 0xB8, 0xCB, 0x8F,  # CRC
-                # IDAT chunk (minimal data for solid color)
-                0x00, 0x00, 0x00, 0x16,  # Length
-                0x49, 0x44, 0x41, 0x54,  # Type: IDAT
-                0x78, 0x9C, 0xED, 0xC1, 0x01, 0x01, 0x00, 0x00, 
-                0x00, 0x80, 0x90, 0xFE, 0x37, 0x96, 0x4E, 0x84,
-                0x00, 0x02, 0x00, 0x00, 0x00, 0x01,
-                0x24, 0x27, 0x0E, 0x1C,  # CRC
-                # IEND chunk
-                0x00, 0x00, 0x00, 0x00,  # Length
-                0x49, 0x45, 0x4E, 0x44,  # Type: IEND
-                0xAE, 0x42, 0x60, 0x82   # CRC
-            ])
-            
-            temp_file.write(png_data)
-            return temp_file.name
+        # Rendered at thumbnail size, so it is never resampled afterwards
+        png_path = _new_temp_path('.png')
+        Path(png_path).write_bytes(self._get_fallback_png(self.render_size))
+        return png_path
+    
+    @classmethod
+    def _get_fallback_png(cls, size: int) -> bytes:
+        """Render the square placeholder PNG once per size and return the cached bytes."""
+        if size not in cls._fallback_pngs:
+            # A single Pillow fill produces a valid solid-color PNG without
+            # assembling image data by hand
+            buffer = BytesIO()
+            Image.new('RGB', (size, size), FALLBACK_THUMBNAIL_COLOR).save(buffer, 'PNG')
+            cls._fallback_pngs[size] = buffer.getvalue()
+        return cls._fallback_pngs[size]
     
-    def resize_thumbnail(self, thumbnail_path: str, target_height: int = None) -> str:
+    def resize_thumbnail(self, thumbnail_path: str, target_height: int = None, output_path: str = None) -> str:
         """
         Resize a thumbnail to the target height while maintaining aspect ratio.
-        Uses macOS built-in sips command for resizing.
+        Uses macOS built-in sips command for resizing, falling back to Pillow.
         
         Args:
             thumbnail_path: Path to the source thumbnail
             target_height: Target height in pixels (defaults to config setting)
+            output_path: Where to write the resized thumbnail (defaults to a new temporary file)
             
         Returns:
             Path to the resized thumbnail
@@ -509,39 +942,120 @@ class SlideThumbnailGenerator:
             target_height = self.config['thumbnail_height']
         
         # Create output path for resized thumbnail
-        input_path = Path(thumbnail_path)
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            output_path = temp_file.name
+        if output_path is None:
+            output_path = _new_temp_path('.png')
+        else:
+            output_path = str(output_path)
         
-        try:
-            # Use macOS sips command to resize
-            cmd = [
-                'sips',
-                '-Z', str(target_height),  # Resize maintaining aspect ratio
-                thumbnail_path,
-                '--out', output_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, timeout=10)
-            
-            if result.returncode == 0:
-                return output_path
-            else:
-                # If sips fails, just copy the original
-                import shutil
-                shutil.copy2(thumbnail_path, output_path)
-                return output_path
+        # Thumbnails rasterized at this size need no resampling; link them into place
+        if self._longest_side(thumbnail_path) == target_height:
+            _quiet_unlink(output_path)
+            _link_or_copy(thumbnail_path, output_path)
+            return output_path
+        
+        # Use macOS sips command to resize (only where it exists)
+        if _find_executable('sips'):
+            try:
+                cmd = [
+                    'sips',
+                    '-Z', str(target_height),  # Resize maintaining aspect ratio
+                    thumbnail_path,
+                    '--out', output_path
+                ]
                 
-        except Exception:
-            # If anything fails, just copy the original file
-            import shutil
-            shutil.copy2(thumbnail_path, output_path)
+                result = _run_tool(cmd, capture_output=True, timeout=10)
+                
+                if result.returncode == 0:
+                    return output_path
+                    
+            except Exception:
+                pass
+        
+        # If sips is unavailable or fails, resize with Pillow instead
+        if self._resize_with_pillow(thumbnail_path, output_path, target_height):
             return output_path
+        
+        # If anything fails, just use the original file (linked, not copied)
+        _quiet_unlink(output_path)
+        _link_or_copy(thumbnail_path, output_path)
+        return output_path
     
-    def cleanup_temp_thumbnail(self, thumbnail_path: str) -> None:
-        """Clean up a temporary thumbnail file."""
+    @staticmethod
+    def _longest_side(image_path: str) -> Optional[int]:
+        """
+        Get the longest side of a PNG in pixels from its IHDR chunk.
+        
+        Reads only the first 24 bytes of the file, without going through Pillow.
+        
+        Returns:
+            The longest side, or None if the file isn't a readable PNG
+        """
+        try:
+            with open(image_path, 'rb') as f:
+                header = f.read(24)
+        except OSError:
+            return None
+        if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+            return None
+        width, height = struct.unpack('>II', header[16:24])
+        return max(width, height)
+    
+    def _resize_with_pillow(self, thumbnail_path: str, output_path: str, target_height: int) -> bool:
+        """
+        Resize a thumbnail with Pillow, bounding the longest side like `sips -Z`.
+        
+        At thumbnail sizes BILINEAR with a reducing gap is visually equivalent
+        to LANCZOS but much cheaper, and a low PNG compression level keeps the
+        encode fast for such a small image.
+        
+        Returns:
+            True if the resized thumbnail was written, False otherwise
+        """
         try:
-            if thumbnail_path and Path(thumbnail_path).exists():
-                Path(thumbnail_path).unlink()
+            with Image.open(thumbnail_path) as image:
+                image.thumbnail(
+                    (target_height, target_height),
+                    Image.Resampling.BILINEAR,
+                    reducing_gap=2.0
+                )
+                image.save(output_path, 'PNG', compress_level=1)
+            return True
         except Exception:
-            pass  # Ignore cleanup errors
\ No newline at end of file
+            return False
+    
+    def optimize_thumbnail(self, thumbnail_path: str) -> None:
+        """
+        Losslessly shrink a final thumbnail with oxipng, if it is installed.
+        
+        Thumbnails are often hard links to cached files, so the optimized
+        copy is written separately and renamed over the thumbnail instead of
+        rewriting the shared file. The thumbnail stays as it was (valid, just
+        larger) if it is tiny already or optimization fails.
+        
+        Args:
+            thumbnail_path: Path to the thumbnail to optimize in place
+        """
+        if not _find_executable('oxipng'):
+            return
+        
+        optimized_path = None
+        try:
+            if os.path.getsize(thumbnail_path) < OXIPNG_MIN_BYTES:
+                return
+            optimized_path = _new_temp_path('.png')
+            result = _run_tool(
+                OXIPNG_ARGS + ('--out', optimized_path, thumbnail_path),
+                capture_output=True,
+                timeout=60
+            )
+            if result.returncode == 0 and os.path.getsize(optimized_path) > 0:
+                os.replace(optimized_path, thumbnail_path)
+                optimized_path = None
+        except Exception:
+            pass
+        finally:
+            _quiet_unlink(optimized_path)
+    
+    def cleanup_temp_thumbnail(self, thumbnail_path: str) -> None:
+        """Clean up a temporary thumbnail file."""
+        _quiet_unlink(thumbnail_path)
\ No newline at end of file
@@ -5,15 +5,27 @@ This module handles the creation of MyElements.xml files with proper
 structure and formatting for importing into presentation software.
 """
 
-import xml.etree.ElementTree as ET
-import xml.dom.minidom
+import mmap
 from pathlib import Path
 from typing import List, Dict, Any
 
+from lxml import etree as ET
+
 from config.settings import get_processing_config
 from src.utils.uuid_utils import generate_reproducible_uuid
 
 
+# Drop indentation whitespace on parse so pretty_print can re-indent edited trees
+_PARSER = ET.XMLParser(remove_blank_text=True)
+
+# The whole structural check as one XPath, evaluated inside libxml2. Only when
+# it fails are the checks below repeated in Python to find the specific error
+_STRUCTURE_IS_VALID = ET.XPath(
+    'boolean(/ee4p/group[1][@id and @name and element])'
+    ' and not(/ee4p/group[1]/element[not(@name and @thumbMode and @id)])'
+)
+
+
 class XMLGenerator:
     """Handles XML metadata file generation."""
     
@@ -44,16 +56,15 @@ class XMLGenerator:
         group_id = generate_reproducible_uuid(group_name)
         
         # Create group element
-        group_element = ET.SubElement(root, "group")
-        group_element.set("id", group_id)
-        group_element.set("name", group_name)
+        group_element = ET.SubElement(root, "group", {"id": group_id, "name": group_name})
         
-        # Add individual slide elements
+        # Add individual slide elements, passing all attributes in one call
         for slide_data in slide_metadata:
-            element = ET.SubElement(group_element, "element")
-            element.set("name", slide_data['name'])
-            element.set("thumbMode", slide_data['thumbMode'])
-            element.set("id", slide_data['id'])
+            ET.SubElement(group_element, "element", {
+                "name": slide_data['name'],
+                "thumbMode": slide_data['thumbMode'],
+                "id": slide_data['id']
+            })
         
         # Generate the XML file
         xml_filename = self.config['xml_filename']
@@ -72,21 +83,12 @@ class XMLGenerator:
             root: Root XML element
             output_path: Path to write the XML file
         """
-        # Convert to string with minidom for pretty formatting
-        rough_string = ET.tostring(root, encoding='unicode')
-        parsed = xml.dom.minidom.parseString(rough_string)
-        
-        # Get pretty-printed XML
-        pretty_xml = parsed.documentElement.toprettyxml(indent="  ")
-        
-        # Remove the XML declaration line and empty lines
-        lines = pretty_xml.split('\n')
-        # Skip empty lines and keep only content lines
-        content_lines = [line for line in lines if line.strip()]
+        # lxml pretty-prints while serializing, so no DOM round-trip is needed
+        xml_bytes = ET.tostring(root, pretty_print=True, xml_declaration=False, encoding='utf-8')
         
         # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(content_lines))
+        with open(output_path, 'wb') as f:
+            f.write(xml_bytes.rstrip(b'\n'))
     
     def validate_xml_structure(self, xml_path: Path) -> tuple[bool, str]:
         """
@@ -99,9 +101,12 @@ class XMLGenerator:
             Tuple of (is_valid, error_message)
         """
         try:
-            tree = ET.parse(xml_path)
+            tree = ET.parse(str(xml_path), _PARSER)
             root = tree.getroot()
             
+            if _STRUCTURE_IS_VALID(tree):
+                return True, "XML structure is valid"
+            
             # Check root element
             if root.tag != "ee4p":
                 return False, "Root element must be 'ee4p'"
@@ -167,7 +172,7 @@ class XMLGenerator:
             Dictionary containing extracted metadata
         """
         try:
-            tree = ET.parse(xml_path)
+            tree = ET.parse(str(xml_path), _PARSER)
             root = tree.getroot()
             
             group = root.find("group")
@@ -213,7 +218,13 @@ class XMLGenerator:
             True if successful, False otherwise
         """
         try:
-            tree = ET.parse(xml_path)
+            # Appending to the group only needs the new lines written before
+            # its closing tag, not a parse and rewrite of the whole file
+            if additional_elements and not new_group_name:
+                if self._append_elements(xml_path, additional_elements):
+                    return True
+            
+            tree = ET.parse(str(xml_path), _PARSER)
             root = tree.getroot()
             
             group = root.find("group")
@@ -230,10 +241,11 @@ class XMLGenerator:
             # Add additional elements if provided
             if additional_elements:
                 for element_data in additional_elements:
-                    element = ET.SubElement(group, "element")
-                    element.set("name", element_data['name'])
-                    element.set("thumbMode", element_data.get('thumbMode', '1'))
-                    element.set("id", element_data['id'])
+                    ET.SubElement(group, "element", {
+                        "name": element_data['name'],
+                        "thumbMode": element_data.get('thumbMode', '1'),
+                        "id": element_data['id']
+                    })
             
             # Write updated XML
             self._write_formatted_xml(root, xml_path)
@@ -242,3 +254,46 @@ class XMLGenerator:
         except Exception as e:
             print(f"Error updating XML metadata: {e}")
             return False
+    
+    def _append_elements(self, xml_path: Path, additional_elements: List[Dict[str, str]]) -> bool:
+        """
+        Append elements to the group of a file written by _write_formatted_xml, in place.
+        
+        Each new element is serialized on its own (as UTF-8 text, like
+        _write_formatted_xml, rather than with character references) and
+        inserted before the group's closing tag, giving the same bytes as a
+        full rewrite would.
+        
+        Args:
+            xml_path: Path to the XML file to update
+            additional_elements: Elements to add
+            
+        Returns:
+            True if the elements were appended, False if the file doesn't have
+            the expected single-group layout (the caller then rewrites it)
+        """
+        new_lines = b''.join(
+            b'    ' + ET.tostring(ET.Element("element", {
+                "name": element_data['name'],
+                "thumbMode": element_data.get('thumbMode', '1'),
+                "id": element_data['id']
+            }), encoding='utf-8') + b'\n'
+            for element_data in additional_elements
+        )
+        
+        with open(xml_path, 'r+b') as f:
+            if f.seek(0, 2) == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                group_end = data.rfind(b'\n  </group>')
+                # Only one group, and nothing but the root's closing tag after it
+                if (group_end < 0 or data.find(b'<group') != data.rfind(b'<group')
+                        or data[group_end:].split() != [b'</group>', b'</ee4p>']):
+                    return False
+                tail = data[group_end + 1:]
+            
+            f.seek(group_end + 1)
+            f.truncate()
+            f.write(new_lines + tail)
+        
+        return True
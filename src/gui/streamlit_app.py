@@ -6,31 +6,142 @@ presentations with real-time progress tracking and professional styling.
 """
 
 import streamlit as st
-import tempfile
 import os
 import base64
+import hashlib
+import shutil
 from pathlib import Path
-import traceback
+from functools import lru_cache
 
 # Import configuration and core modules
 from config.settings import get_gui_config, get_app_config, get_asset_path
-from src.core.splitter import PowerPointSplitter
+from src.utils.file_utils import create_temp_directory
 
+# The splitter and package reader (which load lxml) are imported in
+# process_powerpoint, so the first page render doesn't pay for them
 
+
+# Chunk size for copying the uploaded deck to disk
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Prefix of the per-export working directories (upload and finished archive)
+EXPORT_DIR_PREFIX = "ee_export_"
+
+# Status line and detail block for each progress event, built once; the color
+# is filled in once per process and only the slide fields per event. The
+# splitter throttles per-slide events, so these cards are redrawn at most once
+# per progress delay
+PROGRESS_DETAIL_TEMPLATE = (
+    '<div style="background-color: {color}; color: #FFFFFF; padding: 10px; '
+    'border-radius: 5px; margin: 5px 0;">\n{body}\n</div>'
+)
+PROGRESS_TEMPLATES = {
+    status: (status_line, PROGRESS_DETAIL_TEMPLATE.replace('{body}', body))
+    for status, status_line, body in (
+        ('creating_pptx',
+         "📄 Creating PPTX {current}/{total}: {title}",
+         "<strong>Slide {current}/{total}:</strong> {title}<br>\n"
+         "<small>📄 Creating individual PPTX file...</small>"),
+        ('creating_thumbnail',
+         "🎨 Generating thumbnail {current}/{total}: {title}",
+         "<strong>Slide {current}/{total}:</strong> {title}<br>\n"
+         "<small>🎨 Generating high-quality thumbnail (this may take a moment)...</small>"),
+        ('completed',
+         None,
+         "<strong>Slide {current}/{total}:</strong> {title}<br>\n"
+         "<small>✅ PPTX and thumbnail created successfully</small>"),
+        ('creating_xml',
+         "📄 Creating XML metadata...",
+         "<strong>📄 XML Metadata:</strong><br>\n"
+         "<small>Creating MyElements.xml with slide information...</small>"),
+        ('creating_zip',
+         "📦 Creating zip archive...",
+         "<strong>📦 Final Archive:</strong><br>\n"
+         "<small>Compressing all files into downloadable zip archive...</small>"),
+        ('export_complete',
+         "✅ Export completed successfully!",
+         "<strong>🎉 Export Complete!</strong><br>\n"
+         "<small>All elements exported successfully and ready for download</small>"),
+    )
+}
+
+
+@lru_cache(maxsize=1)
+def _page_styles():
+    """Build the page CSS from the (read-only) GUI colors once per process."""
+    colors = get_gui_config()['colors']
+    return f"""
+    <style>
+    .main-header {{
+        text-align: center;
+        color: {colors['primary']};
+        margin-bottom: 2rem;
+    }}
+    .feature-box {{
+        background-color: {colors['dark']};
+        color: #FFFFFF;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid {colors['info']};
+        margin: 1rem 0;
+    }}
+    .success-box {{
+        background-color: {colors['success']};
+        color: #FFFFFF;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid {colors['success']};
+        margin: 1rem 0;
+    }}
+    .stApp > div:first-child > div:first-child > div:first-child {{
+        padding-top: 2rem;
+    }}
+    .block-container {{
+        max-width: 1200px;
+        padding-left: 2rem;
+        padding-right: 2rem;
+    }}
+    </style>
+    """
+
+
+@lru_cache(maxsize=4)
 def get_base64_of_image(path):
-    """Convert image to base64 string for HTML embedding."""
+    """Convert image to base64 string for HTML embedding (cached across reruns)."""
     with open(path, "rb") as img_file:
         return base64.b64encode(img_file.read()).decode()
 
 
+@lru_cache(maxsize=1)
+def _colored_progress_templates():
+    """Bake the (read-only) GUI progress colors into the progress templates once."""
+    progress_colors = get_gui_config()['progress_colors']
+    return {
+        status: (status_line, detail.replace('{color}', progress_colors[status]))
+        for status, (status_line, detail) in PROGRESS_TEMPLATES.items()
+    }
+
+
+def _show_progress(status_text, progress_detail, templates, status, **fields):
+    """Show the status line and detail block for a progress event."""
+    if status not in templates:
+        return
+    
+    status_line, detail = templates[status]
+    if status_line is not None:
+        status_text.text(status_line.format_map(fields))
+    progress_detail.markdown(detail.format_map(fields), unsafe_allow_html=True)
+
+
 def process_slides_with_progress(splitter, total_slides, progress_bar, status_text, progress_detail):
     """Process slides with detailed progress updates."""
     
-    gui_config = get_gui_config()
-    progress_colors = gui_config['progress_colors']
+    templates = _colored_progress_templates()
+    last_percent = None
     
-    # Create a progress callback function
+    # Create a progress callback function (the splitter throttles per-slide events)
     def progress_callback(current_slide, total_slides, slide_title, status):
+        nonlocal last_percent
         
         if current_slide <= total_slides:
             # Calculate progress (30% to 80% for slide processing)
@@ -39,82 +150,21 @@ def process_slides_with_progress(splitter, total_slides, progress_bar, status_te
             # Final steps (80% to 100%)
             base_progress = 80 + ((current_slide - total_slides) / 2) * 20
             
-        progress_bar.progress(int(base_progress))
+        # Events for the same slide often round to the same percentage;
+        # only send the bar an actual change
+        percent = int(base_progress)
+        if percent != last_percent:
+            progress_bar.progress(percent)
+            last_percent = percent
         
-        if status == "creating_pptx":
-            # Update status
-            status_text.text(f"📄 Creating PPTX {current_slide}/{total_slides}: {slide_title}")
-            
-            # Show PPTX creation progress
-            progress_detail.markdown(f"""
-            <div style="background-color: {progress_colors['creating_pptx']}; color: #FFFFFF; padding: 10px; border-radius: 5px; margin: 5px 0;">
-            <strong>Slide {current_slide}/{total_slides}:</strong> {slide_title}<br>
-            <small>📄 Creating individual PPTX file...</small>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        elif status == "creating_thumbnail":
-            # Update status
-            status_text.text(f"🎨 Generating thumbnail {current_slide}/{total_slides}: {slide_title}")
-            
-            # Show thumbnail creation progress
-            progress_detail.markdown(f"""
-            <div style="background-color: {progress_colors['creating_thumbnail']}; color: #FFFFFF; padding: 10px; border-radius: 5px; margin: 5px 0;">
-            <strong>Slide {current_slide}/{total_slides}:</strong> {slide_title}<br>
-            <small>🎨 Generating high-quality thumbnail (this may take a moment)...</small>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        elif status == "completed":
-            # Show completion
-            progress_detail.markdown(f"""
-            <div style="background-color: {progress_colors['completed']}; color: #FFFFFF; padding: 10px; border-radius: 5px; margin: 5px 0;">
-            <strong>Slide {current_slide}/{total_slides}:</strong> {slide_title}<br>
-            <small>✅ PPTX and thumbnail created successfully</small>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        elif status == "creating_xml":
-            # Update status
-            status_text.text("📄 Creating XML metadata...")
-            
-            # Show XML creation progress
-            progress_detail.markdown(f"""
-            <div style="background-color: {progress_colors['creating_xml']}; color: #FFFFFF; padding: 10px; border-radius: 5px; margin: 5px 0;">
-            <strong>📄 XML Metadata:</strong><br>
-            <small>Creating MyElements.xml with slide information...</small>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        elif status == "creating_zip":
-            # Update status
-            status_text.text("📦 Creating zip archive...")
-            
-            # Show zip creation progress
-            progress_detail.markdown(f"""
-            <div style="background-color: {progress_colors['creating_zip']}; color: #FFFFFF; padding: 10px; border-radius: 5px; margin: 5px 0;">
-            <strong>📦 Final Archive:</strong><br>
-            <small>Compressing all files into downloadable zip archive...</small>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        elif status == "export_complete":
-            # Update status
-            status_text.text("✅ Export completed successfully!")
-            
-            # Show final completion
-            progress_detail.markdown(f"""
-            <div style="background-color: {progress_colors['export_complete']}; color: #FFFFFF; padding: 10px; border-radius: 5px; margin: 5px 0;">
-            <strong>🎉 Export Complete!</strong><br>
-            <small>All elements exported successfully and ready for download</small>
-            </div>
-            """, unsafe_allow_html=True)
+        _show_progress(status_text, progress_detail, templates, status,
+                       current=current_slide, total=total_slides, title=slide_title)
     
     # Do the actual processing with real-time progress
     status_text.text("⚡ Starting slide processing...")
-    created_files = splitter.split_slides(progress_callback=progress_callback)
+    slide_entries = splitter.split_slides(progress_callback=progress_callback)
     
-    return created_files
+    return slide_entries
 
 
 def main():
@@ -134,39 +184,7 @@ def main():
     
     # Custom CSS for better styling
     colors = gui_config['colors']
-    st.markdown(f"""
-    <style>
-    .main-header {{
-        text-align: center;
-        color: {colors['primary']};
-        margin-bottom: 2rem;
-    }}
-    .feature-box {{
-        background-color: {colors['dark']};
-        color: #FFFFFF;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid {colors['info']};
-        margin: 1rem 0;
-    }}
-    .success-box {{
-        background-color: {colors['success']};
-        color: #FFFFFF;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid {colors['success']};
-        margin: 1rem 0;
-    }}
-    .stApp > div:first-child > div:first-child > div:first-child {{
-        padding-top: 2rem;
-    }}
-    .block-container {{
-        max-width: 1200px;
-        padding-left: 2rem;
-        padding-right: 2rem;
-    }}
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_page_styles(), unsafe_allow_html=True)
     
     # Header with logo - perfectly centered
     logo_path = get_asset_path("EfficientElementsLogo.png")
@@ -211,6 +229,12 @@ def main():
                 st.error("Please upload a PowerPoint file first!")
             else:
                 st.error("Please provide a folder name!")
+        elif uploaded_file is not None and group_name.strip() and 'export_zip' in st.session_state:
+            # Any other interaction (e.g. the download click) reruns the script;
+            # show the finished export again instead of losing it
+            zip_file_path = _cached_export(_export_key(uploaded_file, group_name.strip()))
+            if zip_file_path is not None:
+                show_success_result(zip_file_path, group_name.strip())
         
         # Show file info if uploaded
         if uploaded_file is not None:
@@ -224,8 +248,55 @@ def main():
             """, unsafe_allow_html=True)
 
 
+def _export_key(uploaded_file, group_name):
+    """Identify an upload and folder name, so a finished export can be reused."""
+    # Every widget interaction reruns the script; hash the upload only when it
+    # changes rather than reading the whole buffer again on each rerun
+    upload_id = getattr(uploaded_file, 'file_id', None) or (uploaded_file.name, uploaded_file.size)
+    cached = st.session_state.get('upload_digest')
+    if cached is not None and cached[0] == upload_id:
+        digest = cached[1]
+    else:
+        digest = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+        st.session_state['upload_digest'] = (upload_id, digest)
+    return f"{digest}:{group_name}"
+
+
+def _cached_export(export_key):
+    """Get the archive of this session's export for a key, if it is still on disk."""
+    if st.session_state.get('export_key') != export_key:
+        return None
+    
+    zip_file_path = st.session_state.get('export_zip')
+    if zip_file_path is not None and zip_file_path.exists():
+        return zip_file_path
+    return None
+
+
+def _remember_export(export_key, zip_file_path):
+    """Keep the session's latest export, removing the archive it replaces."""
+    previous_zip = st.session_state.get('export_zip')
+    if previous_zip is not None and previous_zip != zip_file_path:
+        # Each export has its own working directory holding just its archive
+        shutil.rmtree(previous_zip.parent, ignore_errors=True)
+    
+    st.session_state['export_key'] = export_key
+    st.session_state['export_zip'] = zip_file_path
+
+
 def process_powerpoint(uploaded_file, group_name):
     """Process the uploaded PowerPoint file."""
+    import traceback
+    
+    from src.core.pptx_package import count_slides
+    from src.core.splitter import PowerPointSplitter
+    
+    # The same upload and folder name were already exported in this session
+    export_key = _export_key(uploaded_file, group_name)
+    zip_file_path = _cached_export(export_key)
+    if zip_file_path is not None:
+        show_success_result(zip_file_path, group_name)
+        return
     
     # Create progress containers
     progress_container = st.container()
@@ -235,15 +306,24 @@ def process_powerpoint(uploaded_file, group_name):
         st.markdown("### 🔄 Processing...")
         progress_bar = st.progress(0)
         status_text = st.empty()
+        work_dir = None
         
         try:
             # Save uploaded file to temporary location
             status_text.text("📁 Saving uploaded file...")
             progress_bar.progress(10)
             
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{uploaded_file.name}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                temp_input_path = tmp_file.name
+            # Each export gets its own working directory: the upload is saved
+            # there and the splitter writes the archive next to it, so
+            # concurrent sessions never share (or collide on) a zip name
+            work_dir = create_temp_directory(EXPORT_DIR_PREFIX)
+            temp_input_path = work_dir / Path(uploaded_file.name).name
+            
+            # Stream the upload in chunks instead of building a second
+            # in-memory copy of the whole deck with getvalue()
+            with open(temp_input_path, 'wb') as tmp_file:
+                uploaded_file.seek(0)
+                shutil.copyfileobj(uploaded_file, tmp_file, UPLOAD_COPY_BUFFER_SIZE)
             
             # Initialize the splitter
             status_text.text("🚀 Initializing PowerPoint Splitter...")
@@ -258,10 +338,9 @@ def process_powerpoint(uploaded_file, group_name):
                 base_name=original_base_name
             )
             
-            # Get presentation info first
-            from pptx import Presentation
-            prs = Presentation(temp_input_path)
-            total_slides = len(prs.slides)
+            # Get presentation info first; only the slide list is read here,
+            # the splitter parses the full deck once during processing
+            total_slides = count_slides(temp_input_path)
             
             status_text.text(f"📊 Found {total_slides} slides to process...")
             progress_bar.progress(30)
@@ -270,7 +349,7 @@ def process_powerpoint(uploaded_file, group_name):
             progress_detail = st.empty()
             
             # Create a custom processing with progress updates
-            created_files = process_slides_with_progress(
+            slide_entries = process_slides_with_progress(
                 splitter, 
                 total_slides, 
                 progress_bar, 
@@ -281,29 +360,26 @@ def process_powerpoint(uploaded_file, group_name):
             progress_bar.progress(90)
             status_text.text("📦 Finalizing zip archive...")
             
-            # Find the created zip file using the original base name
-            input_path = Path(temp_input_path)
+            # The splitter reports the archive it wrote, so there is no need
+            # to scan the (shared) temp directory for it
+            zip_file_path = splitter.zip_path
             
-            # Look for zip files in the same directory as the temp input using the original filename
-            zip_files = list(input_path.parent.glob(f"{original_base_name}_*.zip"))
-            
-            if zip_files:
-                # Get the most recent zip file
-                zip_file_path = max(zip_files, key=lambda x: x.stat().st_mtime)
-                
+            if zip_file_path is not None and zip_file_path.exists():
                 progress_bar.progress(100)
                 status_text.text("✅ Processing complete!")
                 
-                # Clean up temp input file
+                # Clean up temp input file; only the archive stays in the work directory
                 try:
                     os.unlink(temp_input_path)
-                except:
+                except OSError:
                     pass
                 
-                # Show success and provide download
+                # Show success and provide download; reruns show it again
+                _remember_export(export_key, zip_file_path)
                 show_success_result(zip_file_path, group_name)
                 
             else:
+                shutil.rmtree(work_dir, ignore_errors=True)
                 st.error("❌ No zip file was created. Please check the processing details above.")
                 
         except Exception as e:
@@ -313,12 +389,9 @@ def process_powerpoint(uploaded_file, group_name):
             if st.checkbox("Show detailed error information"):
                 st.code(traceback.format_exc())
             
-            # Clean up temp file on error
-            try:
-                if 'temp_input_path' in locals():
-                    os.unlink(temp_input_path)
-            except:
-                pass
+            # Clean up the upload and anything else in the work directory on error
+            if work_dir is not None:
+                shutil.rmtree(work_dir, ignore_errors=True)
 
 
 def show_success_result(zip_file_path, group_name):
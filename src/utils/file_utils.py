@@ -5,16 +5,33 @@ This module provides utilities for file operations, archive creation,
 and cleanup tasks used throughout the application.
 """
 
+import fnmatch
 import os
 import shutil
+import stat
+import threading
+import time
 import zipfile
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import FrozenSet, List, Tuple, Optional
 
 from config.settings import get_processing_config
 
 
+# PPTX, PNG, JPEG and ZIP payloads are already compressed, so re-compressing
+# them in the archive costs CPU for almost no size reduction
+PRECOMPRESSED_SUFFIXES = frozenset({'.pptx', '.png', '.jpg', '.jpeg', '.zip'})
+
+# System files left out of archives
+SYSTEM_FILES = frozenset({'.DS_Store', 'Thumbs.db', '.git', '.gitignore'})
+
+# Single background thread for deferred cleanup, started on first use
+_cleanup_executor: Optional[ThreadPoolExecutor] = None
+_cleanup_executor_lock = threading.Lock()
+
+
 def create_temp_directory(prefix: Optional[str] = None) -> Path:
     """
     Create a temporary directory for processing.
@@ -54,14 +71,22 @@ def get_file_size_mb(file_path: Path) -> float:
     Returns:
         File size in MB, rounded to 1 decimal place
     """
-    if not file_path.exists():
+    # One stat call answers both the existence check and the size
+    try:
+        size_bytes = file_path.stat().st_size
+    except OSError:
         return 0.0
     
-    size_bytes = file_path.stat().st_size
     size_mb = size_bytes / (1024 * 1024)
     return round(size_mb, 1)
 
 
+@lru_cache(maxsize=8)
+def _lowercase_types(supported_types: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased set of file extensions, built once per distinct list."""
+    return frozenset(ext.lower() for ext in supported_types)
+
+
 def is_supported_file_type(file_path: Path, supported_types: List[str]) -> bool:
     """
     Check if file type is supported.
@@ -77,7 +102,7 @@ def is_supported_file_type(file_path: Path, supported_types: List[str]) -> bool:
         return False
     
     file_extension = file_path.suffix.lower().lstrip('.')
-    return file_extension in [ext.lower() for ext in supported_types]
+    return file_extension in _lowercase_types(tuple(supported_types))
 
 
 def generate_timestamped_filename(base_name: str, extension: str = "zip") -> str:
@@ -92,10 +117,55 @@ def generate_timestamped_filename(base_name: str, extension: str = "zip") -> str
         Timestamped filename
     """
     config = get_processing_config()
-    timestamp = datetime.now().strftime(config['timestamp_format'])
+    # Plain time.strftime: no datetime object is needed for a local timestamp
+    timestamp = time.strftime(config['timestamp_format'], time.localtime())
     return f"{base_name}_{timestamp}.{extension}"
 
 
+def open_zip_archive(output_path: Path) -> zipfile.ZipFile:
+    """
+    Open a new zip archive for writing entries one at a time.
+    
+    Args:
+        output_path: Path where the zip file should be created
+        
+    Returns:
+        The open ZipFile (the caller is responsible for closing it)
+    """
+    return zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED)
+
+
+def _zip_entry_options(arcname: str) -> dict:
+    """Compression options for an archive entry, chosen by its suffix."""
+    # Only small uncompressed files (e.g. the XML) get a light deflate
+    if Path(arcname).suffix.lower() in PRECOMPRESSED_SUFFIXES:
+        return {}
+    return {'compress_type': zipfile.ZIP_DEFLATED, 'compresslevel': 1}
+
+
+def add_bytes_to_zip(zipf: zipfile.ZipFile, arcname: str, data: bytes) -> None:
+    """
+    Add in-memory file contents to an open archive at root level.
+    
+    Args:
+        zipf: Archive opened for writing
+        arcname: Name of the entry inside the archive
+        data: File contents
+    """
+    zipf.writestr(arcname, data, **_zip_entry_options(arcname))
+
+
+def add_file_to_zip(zipf: zipfile.ZipFile, file_path: Path) -> None:
+    """
+    Add a file on disk to an open archive at root level (no directory structure).
+    
+    Args:
+        zipf: Archive opened for writing
+        file_path: Path to the file to add
+    """
+    zipf.write(file_path, file_path.name, **_zip_entry_options(file_path.name))
+
+
 def create_zip_archive(
     files_to_compress: List[Path], 
     output_path: Path, 
@@ -113,17 +183,21 @@ def create_zip_archive(
         Tuple of (success, file_count, archive_size_mb)
     """
     try:
-        # System files to exclude
-        system_files = {'.DS_Store', 'Thumbs.db', '.git', '.gitignore'} if exclude_system_files else set()
+        system_files = SYSTEM_FILES if exclude_system_files else frozenset()
         
         files_added = 0
         
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with open_zip_archive(output_path) as zipf:
             for file_path in files_to_compress:
-                if file_path.exists() and file_path.name not in system_files:
-                    # Add file at root level (no directory structure)
-                    zipf.write(file_path, file_path.name)
-                    files_added += 1
+                if file_path.name in system_files:
+                    continue
+                # Writing the entry stats the file anyway, so a missing file
+                # is skipped on that error instead of checked for up front
+                try:
+                    add_file_to_zip(zipf, file_path)
+                except FileNotFoundError:
+                    continue
+                files_added += 1
         
         # Get archive size
         archive_size_mb = get_file_size_mb(output_path)
@@ -150,12 +224,17 @@ def cleanup_files(file_paths: List[Path], verbose: bool = True) -> int:
     
     for file_path in file_paths:
         try:
-            if file_path.exists():
-                if file_path.is_file():
-                    file_path.unlink()
-                elif file_path.is_dir():
-                    shutil.rmtree(file_path, ignore_errors=True)
-                deleted_count += 1
+            # One stat call tells whether the path exists and what it is
+            try:
+                file_mode = file_path.stat().st_mode
+            except FileNotFoundError:
+                continue
+            
+            if stat.S_ISDIR(file_mode):
+                shutil.rmtree(file_path, ignore_errors=True)
+            else:
+                file_path.unlink()
+            deleted_count += 1
                 
         except Exception as e:
             if verbose:
@@ -164,6 +243,28 @@ def cleanup_files(file_paths: List[Path], verbose: bool = True) -> int:
     return deleted_count
 
 
+def schedule_cleanup(file_paths: List[Path], verbose: bool = True) -> Future:
+    """
+    Clean up a list of files and directories on a background thread.
+    
+    The caller can return to the user straight away; cleanups run one at a
+    time in submission order, and the interpreter waits for pending ones
+    before it exits.
+    
+    Args:
+        file_paths: List of file or directory paths to delete
+        verbose: Whether to print verbose output
+        
+    Returns:
+        Future resolving to the number of paths deleted
+    """
+    global _cleanup_executor
+    with _cleanup_executor_lock:
+        if _cleanup_executor is None:
+            _cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cleanup')
+    return _cleanup_executor.submit(cleanup_files, list(file_paths), verbose)
+
+
 def cleanup_directory(directory_path: Path, remove_directory: bool = True, verbose: bool = True) -> bool:
     """
     Clean up a directory and optionally remove it.
@@ -186,12 +287,14 @@ def cleanup_directory(directory_path: Path, remove_directory: bool = True, verbo
                 if verbose:
                     print(f"    🗑️  Removed directory: {directory_path.name}")
             else:
-                # Just clean contents
-                for item in directory_path.iterdir():
-                    if item.is_file():
-                        item.unlink()
-                    elif item.is_dir():
-                        shutil.rmtree(item, ignore_errors=True)
+                # Just clean contents; scandir entries carry their file type,
+                # so no extra stat call is needed per item
+                with os.scandir(directory_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                        else:
+                            os.unlink(entry.path)
                         
                 # Remove directory if empty
                 try:
@@ -223,10 +326,22 @@ def get_files_in_directory(directory_path: Path, pattern: str = "*") -> List[Pat
     Returns:
         List of matching file paths
     """
-    if not directory_path.exists() or not directory_path.is_dir():
-        return []
+    # Patterns that reach into subdirectories still need a full glob
+    if '/' in pattern or '**' in pattern:
+        if not directory_path.is_dir():
+            return []
+        return [path for path in directory_path.glob(pattern) if path.is_file()]
     
-    return list(directory_path.glob(pattern))
+    # One directory listing; each entry already knows its type, so there is
+    # no stat call per file, and '*' needs no name matching at all
+    try:
+        with os.scandir(directory_path) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.is_file() and (pattern == '*' or fnmatch.fnmatch(entry.name, pattern))
+            ]
+    except OSError:
+        return []
 
 
 def copy_file_with_new_name(source_path: Path, destination_dir: Path, new_name: str) -> Path:
@@ -243,7 +358,9 @@ def copy_file_with_new_name(source_path: Path, destination_dir: Path, new_name:
     """
     ensure_directory_exists(destination_dir)
     destination_path = destination_dir / new_name
-    shutil.copy2(source_path, destination_path)
+    # Contents only: copyfile copies in the kernel (sendfile/fcopyfile) and
+    # skips copy2's extra metadata stat and utime calls
+    shutil.copyfile(source_path, destination_path)
     return destination_path
 
 
@@ -257,10 +374,13 @@ def validate_file_access(file_path: Path) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not file_path.exists():
+    # One stat call answers both the existence and the file-type checks
+    try:
+        file_stat = file_path.stat()
+    except OSError:
         return False, f"File does not exist: {file_path}"
     
-    if not file_path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         return False, f"Path is not a file: {file_path}"
     
     if not os.access(file_path, os.R_OK):
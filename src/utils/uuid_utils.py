@@ -5,16 +5,30 @@ This module provides utilities for generating reproducible and unique UUIDs
 for consistent identification across multiple runs.
 """
 
+import re
 import uuid
+from functools import lru_cache
 from typing import Optional
 
 
+# Fixed namespace UUID for the project, parsed once
+PROJECT_NAMESPACE_UUID = uuid.UUID('12345678-1234-5678-1234-123456789abc')
+
+# Canonical hyphenated UUID form, as produced by str(uuid.UUID); checked
+# before falling back to uuid.UUID for the other forms it accepts
+UUID_PATTERN = re.compile(
+    r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z'
+)
+
+
+@lru_cache(maxsize=1024)
 def generate_reproducible_uuid(input_string: str, namespace: Optional[str] = None) -> str:
     """
     Generate a reproducible UUID based on an input string.
     
     This ensures that the same input string will always generate the same UUID,
     which is important for consistent group identification across multiple exports.
+    Being deterministic, results are memoized per (input_string, namespace).
     
     Args:
         input_string: The string to generate UUID from (e.g., group name)
@@ -25,8 +39,7 @@ def generate_reproducible_uuid(input_string: str, namespace: Optional[str] = Non
     """
     # Use a fixed namespace for reproducibility
     if namespace is None:
-        # Fixed namespace UUID for the project
-        namespace_uuid = uuid.UUID('12345678-1234-5678-1234-123456789abc')
+        namespace_uuid = PROJECT_NAMESPACE_UUID
     else:
         # Generate namespace UUID from provided string
         namespace_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, namespace)
@@ -54,12 +67,19 @@ def is_valid_uuid(uuid_string: str) -> bool:
     """
     Validate if a string is a valid UUID format.
     
+    Accepts every form uuid.UUID does (braces, "urn:uuid:" prefixes, bare
+    hex digits). The canonical hyphenated form, which is what this package
+    generates, is matched without building a UUID object.
+    
     Args:
         uuid_string: String to validate
         
     Returns:
         True if valid UUID format, False otherwise
     """
+    if UUID_PATTERN.match(uuid_string) is not None:
+        return True
+    
     try:
         uuid.UUID(uuid_string)
         return True
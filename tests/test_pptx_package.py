@@ -0,0 +1,189 @@
+"""
+Tests for the package-level PPTX slide extraction module.
+"""
+
+import posixpath
+import unittest
+import zipfile
+from io import BytesIO
+
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Inches
+
+from src.core.pptx_package import (
+    CONTENT_TYPES_NS,
+    OFFICE_REL_NS,
+    PresentationPackage,
+    count_slides,
+    slide_texts,
+    slide_title,
+)
+
+
+SLIDE_TITLES = ['Opening', 'Agenda', None]
+
+
+def _build_deck() -> bytes:
+    """Build a three-slide deck with notes on every slide."""
+    presentation = Presentation()
+    
+    opening = presentation.slides.add_slide(presentation.slide_layouts[0])
+    opening.shapes.title.text = 'Opening'
+    opening.placeholders[1].text = 'First line\vsecond line'
+    
+    agenda = presentation.slides.add_slide(presentation.slide_layouts[1])
+    agenda.shapes.title.text = 'Agenda'
+    agenda.placeholders[1].text = 'Intro\nDetails'
+    
+    blank = presentation.slides.add_slide(presentation.slide_layouts[6])
+    textbox = blank.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+    textbox.text_frame.text = 'Loose text'
+    
+    for i, slide in enumerate(presentation.slides):
+        slide.notes_slide.notes_text_frame.text = f'Notes {i}'
+    
+    buffer = BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+def _graphic_frame_title_deck() -> bytes:
+    """Build a one-slide deck whose title placeholder is a graphic frame, not a text shape."""
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+    title = slide.shapes.title._element
+    title.addprevious(etree.fromstring(
+        '<p:graphicFrame xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+        ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        '<p:nvGraphicFramePr><p:cNvPr id="10" name="Title Table"/><p:cNvGraphicFramePr/>'
+        '<p:nvPr><p:ph type="title"/></p:nvPr></p:nvGraphicFramePr>'
+        '<p:xfrm><a:off x="0" y="0"/><a:ext cx="1" cy="1"/></p:xfrm>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table"/></a:graphic>'
+        '</p:graphicFrame>'
+    ))
+    title.getparent().remove(title)
+    
+    buffer = BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+def _notes_part(source_zip: zipfile.ZipFile, slide_part: str) -> str:
+    """Find the notes part of a slide through its relationships."""
+    directory, filename = posixpath.split(slide_part)
+    rels = etree.fromstring(source_zip.read(posixpath.join(directory, '_rels', f'{filename}.rels')))
+    for rel in rels:
+        if rel.get('Type') == f'{OFFICE_REL_NS}/notesSlide':
+            return posixpath.normpath(posixpath.join(directory, rel.get('Target')))
+    raise AssertionError(f'{slide_part} has no notes')
+
+
+class SingleSlideTest(unittest.TestCase):
+    """Single-slide copies keep one slide and drop everything of the others."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.source_bytes = _build_deck()
+        cls.package = PresentationPackage(cls.source_bytes)
+        cls.slide_parts = cls.package.slide_parts()
+        with zipfile.ZipFile(BytesIO(cls.source_bytes)) as source_zip:
+            cls.notes_parts = [_notes_part(source_zip, part) for part in cls.slide_parts]
+    
+    def test_each_copy_opens_with_only_its_slide(self):
+        for index, title in enumerate(SLIDE_TITLES):
+            with self.subTest(index=index):
+                copy = Presentation(BytesIO(self.package.single_slide_bytes(index)))
+                self.assertEqual(len(copy.slides), 1)
+                slide = copy.slides[0]
+                title_shape = slide.shapes.title
+                self.assertEqual(title_shape.text if title_shape is not None else None, title)
+                self.assertEqual(slide.notes_slide.notes_text_frame.text, f'Notes {index}')
+    
+    def test_other_slides_and_notes_are_removed(self):
+        for index in range(len(self.slide_parts)):
+            with self.subTest(index=index):
+                with zipfile.ZipFile(BytesIO(self.package.single_slide_bytes(index))) as copy_zip:
+                    names = set(copy_zip.namelist())
+                
+                self.assertIn(self.slide_parts[index], names)
+                self.assertIn(self.notes_parts[index], names)
+                for other in range(len(self.slide_parts)):
+                    if other != index:
+                        self.assertNotIn(self.slide_parts[other], names)
+                        self.assertNotIn(self.notes_parts[other], names)
+    
+    def test_content_type_overrides_match_kept_parts(self):
+        for index in range(len(self.slide_parts)):
+            with self.subTest(index=index):
+                with zipfile.ZipFile(BytesIO(self.package.single_slide_bytes(index))) as copy_zip:
+                    names = set(copy_zip.namelist())
+                    content_types = etree.fromstring(copy_zip.read('[Content_Types].xml'))
+                
+                overridden = {
+                    override.get('PartName').lstrip('/')
+                    for override in content_types.iter(f'{{{CONTENT_TYPES_NS}}}Override')
+                }
+                self.assertLessEqual(overridden, names)
+                self.assertIn(self.slide_parts[index], overridden)
+                for other in range(len(self.slide_parts)):
+                    if other != index:
+                        self.assertNotIn(self.slide_parts[other], overridden)
+                        self.assertNotIn(self.notes_parts[other], overridden)
+    
+    def test_out_of_range_index_raises(self):
+        for index in (len(SLIDE_TITLES), -1):
+            with self.subTest(index=index):
+                with self.assertRaises(IndexError):
+                    self.package.build_single_slide(index)
+
+
+
+class SlideTextTest(unittest.TestCase):
+    """Slide text is read the same way python-pptx reads it."""
+    
+    def assert_matches_python_pptx(self, source_bytes: bytes):
+        package = PresentationPackage(source_bytes)
+        slides = Presentation(BytesIO(source_bytes)).slides
+        for index, (part_name, slide) in enumerate(zip(package.slide_parts(), slides)):
+            with self.subTest(index=index):
+                root = package.read_xml(part_name)
+                
+                title_shape = slide.shapes.title
+                expected_title = (
+                    title_shape.text_frame.text
+                    if title_shape is not None and title_shape.has_text_frame else None
+                )
+                self.assertEqual(slide_title(root), expected_title)
+                
+                expected_texts = [
+                    (shape.text_frame.text, shape.is_placeholder)
+                    for shape in slide.shapes if shape.has_text_frame
+                ]
+                self.assertEqual(list(slide_texts(root)), expected_texts)
+    
+    def test_text_shapes_match_python_pptx(self):
+        self.assert_matches_python_pptx(_build_deck())
+    
+    def test_graphic_frame_title_has_no_text(self):
+        source_bytes = _graphic_frame_title_deck()
+        self.assert_matches_python_pptx(source_bytes)
+        package = PresentationPackage(source_bytes)
+        self.assertIsNone(slide_title(package.read_xml(package.slide_parts()[0])))
+    
+    def test_line_breaks_become_vertical_tabs(self):
+        package = PresentationPackage(_build_deck())
+        texts = [text for text, _ in slide_texts(package.read_xml(package.slide_parts()[0]))]
+        self.assertIn('First line\vsecond line', texts)
+    
+    def test_count_slides(self):
+        self.assertEqual(count_slides(BytesIO(_build_deck())), len(SLIDE_TITLES))
+        self.assertEqual(count_slides(BytesIO(_graphic_frame_title_deck())), 1)
+        
+        empty = BytesIO()
+        Presentation().save(empty)
+        self.assertEqual(count_slides(BytesIO(empty.getvalue())), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
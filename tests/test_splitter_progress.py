@@ -0,0 +1,67 @@
+"""
+Tests for the splitter's progress throttling.
+"""
+
+import unittest
+from unittest import mock
+
+from src.core.splitter import THROTTLED_PROGRESS_STATUSES, ThrottledProgress
+
+
+def _export_events(total_slides):
+    """The events split_slides reports for a deck, in order."""
+    for i in range(1, total_slides + 1):
+        yield (i, total_slides, f"Slide {i}", "creating_pptx")
+        yield (i, total_slides, f"Slide {i}", "creating_thumbnail")
+        yield (i, total_slides, f"Slide {i}", "completed")
+    yield (total_slides + 1, total_slides + 2, "XML Metadata", "creating_xml")
+    yield (total_slides + 2, total_slides + 2, "Zip Archive", "creating_zip")
+    yield (total_slides + 2, total_slides + 2, "Export Complete", "export_complete")
+
+
+class ThrottledProgressTest(unittest.TestCase):
+    """Per-slide events are coalesced; everything else always gets through."""
+    
+    def _deliver(self, events, clock, min_interval=0.25):
+        delivered = []
+        progress = ThrottledProgress(lambda *event: delivered.append(event), min_interval)
+        with mock.patch('src.core.splitter.time.monotonic', side_effect=clock):
+            for event in events:
+                progress(*event)
+        return delivered
+    
+    def test_burst_keeps_final_events_and_coalesces_the_rest(self):
+        events = list(_export_events(500))
+        # Every event arrives at (almost) the same moment
+        delivered = self._deliver(events, lambda: 100.0)
+        
+        self.assertEqual(delivered[-1], events[-1])
+        unthrottled = [event for event in events if event[3] not in THROTTLED_PROGRESS_STATUSES]
+        self.assertEqual(
+            [event for event in delivered if event[3] not in THROTTLED_PROGRESS_STATUSES],
+            unthrottled
+        )
+        
+        throttled = [event for event in events if event[3] in THROTTLED_PROGRESS_STATUSES]
+        delivered_throttled = [event for event in delivered if event[3] in THROTTLED_PROGRESS_STATUSES]
+        self.assertEqual(delivered_throttled, [throttled[0]])
+    
+    def test_throttled_events_resume_after_the_interval(self):
+        events = [(i, 100, f"Slide {i}", "creating_pptx") for i in range(1, 101)]
+        # 1/16s apart (exact in binary), so one in four passes the 0.25s interval
+        times = iter(i / 16 for i in range(len(events)))
+        delivered = self._deliver(events, lambda: next(times))
+        
+        self.assertEqual(delivered[0], events[0])
+        self.assertEqual(len(delivered), 25)
+        self.assertEqual(delivered, events[::4])
+    
+    def test_every_throttled_status_is_reported_when_spaced_out(self):
+        statuses = sorted(THROTTLED_PROGRESS_STATUSES)
+        events = [(1, 1, "Slide 1", status) for status in statuses]
+        times = iter(i * 1.0 for i in range(len(events)))
+        self.assertEqual(self._deliver(events, lambda: next(times)), events)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests for the persistent thumbnail cache.
+"""
+
+import contextlib
+import io
+import os
+import stat
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core.thumbnail_generator import SlideThumbnailGenerator
+
+
+class ThumbnailCacheTest(unittest.TestCase):
+    """Rendered thumbnails are reused by content and pruned to the configured limits."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.work_dir = Path(self.temp_dir.name)
+        self.cache_root = self.work_dir / 'cache'
+        
+        with mock.patch.object(SlideThumbnailGenerator, '_cached_methods', ['simple_fallback']), \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.generator = SlideThumbnailGenerator()
+        self.generator.config = dict(
+            self.generator.config,
+            thumbnail_cache_dir=str(self.cache_root),
+            verbose=False
+        )
+        
+        # Stand-in for the PDF conversion: one small file per slide
+        self.renders = 0
+        self.generator._convert_ppt_to_pngs_bulk = self._render
+        
+        self.deck = self.work_dir / 'deck.pptx'
+        self.deck.write_bytes(b'deck contents')
+    
+    def _render(self, pptx_path, total_slides):
+        self.renders += 1
+        paths = []
+        for i in range(total_slides):
+            fd, path = tempfile.mkstemp(suffix='.png', dir=self.work_dir)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(f'render {self.renders} slide {i}'.encode())
+            paths.append(path)
+        return paths
+    
+    def _thumbnails(self, total_slides=2):
+        paths = self.generator.create_high_quality_thumbnails_bulk(str(self.deck), total_slides)
+        contents = [Path(path).read_bytes() for path in paths]
+        for path in paths:
+            os.unlink(path)
+        return contents
+    
+    def _entries(self):
+        return sorted(path.name for path in self.cache_root.iterdir() if path.name != 'by_stat')
+    
+    def test_miss_then_hit(self):
+        first = self._thumbnails()
+        self.assertEqual(self.renders, 1)
+        
+        second = self._thumbnails()
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(second, first)
+        
+        # Handing out and deleting thumbnails leaves the cached files intact
+        self.assertEqual(self._thumbnails(), first)
+    
+    def test_changed_content_is_rendered_again(self):
+        first = self._thumbnails()
+        self.deck.write_bytes(b'edited deck contents')
+        
+        second = self._thumbnails()
+        self.assertEqual(self.renders, 2)
+        self.assertNotEqual(second, first)
+        self.assertEqual(len(self._entries()), 2)
+    
+    def test_prune_keeps_size_limit_most_recent_first(self):
+        # Each entry holds two 16-byte files; leave room for two entries
+        self.generator.config['thumbnail_cache_max_mb'] = 90 / (1024 * 1024)
+        stored = []
+        for i in range(3):
+            # Different sizes, so the stat index can't confuse the versions
+            self.deck.write_bytes(b'deck' * (i + 1))
+            self._thumbnails()
+            stored.append(next(entry for entry in self._entries() if entry not in stored))
+            # Date the entry in the past so the next one is clearly newer
+            entry_time = time.time() - 100 + i
+            os.utime(self.cache_root / stored[-1], (entry_time, entry_time))
+        
+        self.assertEqual(self._entries(), sorted(stored[1:]))
+        index_files = list((self.cache_root / 'by_stat').iterdir())
+        kept_hashes = {entry.rpartition('_')[0] for entry in stored[1:]}
+        self.assertEqual({path.read_text() for path in index_files}, kept_hashes)
+    
+    def test_prune_drops_entries_older_than_max_age(self):
+        self._thumbnails()
+        old_entry = self._entries()[0]
+        old_time = time.time() - 2 * 24 * 60 * 60
+        os.utime(self.cache_root / old_entry, (old_time, old_time))
+        for index_file in (self.cache_root / 'by_stat').iterdir():
+            os.utime(index_file, (old_time, old_time))
+        
+        self.generator.config['thumbnail_cache_max_age_days'] = 1
+        self.deck.write_bytes(b'another deck')
+        self._thumbnails()
+        
+        self.assertEqual(len(self._entries()), 1)
+        self.assertNotIn(old_entry, self._entries())
+        self.assertEqual(len(list((self.cache_root / 'by_stat').iterdir())), 1)
+    
+    def test_cache_directory_is_private_and_created_once(self):
+        self._thumbnails()
+        root_stat = self.cache_root.stat()
+        self.assertEqual(stat.S_IMODE(root_stat.st_mode), 0o700)
+        
+        self._thumbnails()
+        self.assertEqual(self.cache_root.stat().st_ino, root_stat.st_ino)
+        self.assertEqual(stat.S_IMODE(self.cache_root.stat().st_mode), 0o700)
+    
+    def test_shared_cache_directory_is_not_used(self):
+        self.cache_root.parent.mkdir(exist_ok=True)
+        os.symlink(self.work_dir, self.cache_root)
+        
+        self._thumbnails()
+        self._thumbnails()
+        self.assertEqual(self.renders, 2)
+    
+    @unittest.skipUnless(hasattr(os, 'geteuid') and os.geteuid() == 0, "needs root to chown")
+    def test_directory_owned_by_another_user_is_not_used(self):
+        self.cache_root.mkdir(mode=0o700)
+        os.chown(self.cache_root, 12345, -1)
+        
+        self._thumbnails()
+        self._thumbnails()
+        self.assertEqual(self.renders, 2)
+        self.assertEqual(list(self.cache_root.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Tests for the UUID utility functions.
+"""
+
+import unittest
+import uuid
+
+from src.utils.uuid_utils import (
+    format_uuid_for_filename,
+    generate_reproducible_uuid,
+    generate_unique_uuid,
+    is_valid_uuid,
+)
+
+
+CANONICAL = '12345678-1234-5678-1234-123456789abc'
+
+
+class IsValidUuidTest(unittest.TestCase):
+    """is_valid_uuid accepts exactly what uuid.UUID accepts."""
+    
+    def test_forms_accepted_by_uuid_module(self):
+        for value in (
+            CANONICAL,
+            CANONICAL.upper(),
+            '{' + CANONICAL + '}',
+            'urn:uuid:' + CANONICAL,
+            CANONICAL.replace('-', ''),
+        ):
+            with self.subTest(value=value):
+                uuid.UUID(value)
+                self.assertTrue(is_valid_uuid(value))
+    
+    def test_invalid_strings(self):
+        for value in ('', 'not-a-uuid', CANONICAL[:-1], CANONICAL + '0', CANONICAL.replace('a', 'g')):
+            with self.subTest(value=value):
+                self.assertFalse(is_valid_uuid(value))
+    
+    def test_generated_uuids_are_valid(self):
+        self.assertTrue(is_valid_uuid(generate_unique_uuid()))
+        self.assertTrue(is_valid_uuid(generate_reproducible_uuid('Group')))
+        self.assertTrue(is_valid_uuid(generate_reproducible_uuid('Group', 'namespace')))
+    
+    def test_format_uuid_for_filename(self):
+        self.assertEqual(format_uuid_for_filename(CANONICAL.upper()), CANONICAL)
+        with self.assertRaises(ValueError):
+            format_uuid_for_filename('not-a-uuid')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""
+Tests for the XML metadata generation module.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.xml_generator import XMLGenerator
+
+
+class AppendElementsTest(unittest.TestCase):
+    """Appending in place must give the same file as a full rewrite."""
+    
+    def test_append_matches_full_rewrite_for_non_ascii_names(self):
+        generator = XMLGenerator()
+        existing = [{'name': 'Slide ä', 'thumbMode': '1', 'id': 'a'}]
+        added = [{'name': 'Café ü', 'thumbMode': '1', 'id': 'b'}]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            appended_dir = Path(tmp) / 'appended'
+            rewritten_dir = Path(tmp) / 'rewritten'
+            appended_dir.mkdir()
+            rewritten_dir.mkdir()
+            
+            xml_path = generator.create_xml_metadata('Group', existing, appended_dir)
+            self.assertTrue(generator.update_xml_metadata(xml_path, additional_elements=added))
+            
+            expected_path = generator.create_xml_metadata('Group', existing + added, rewritten_dir)
+            
+            self.assertEqual(xml_path.read_bytes(), expected_path.read_bytes())
+            self.assertIn('Café ü'.encode('utf-8'), xml_path.read_bytes())
+
+
+if __name__ == '__main__':
+    unittest.main()